@@ -8,11 +8,13 @@ using yt-dlp and other methods.
 import os
 import re
 import logging
+import threading
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import yt_dlp
@@ -179,7 +181,8 @@ class AudioDownloader:
         return filename
     
     def search_and_download_track(self, track: Track, search_engines: Optional[List[str]] = None,
-                                  playlist_folder: Optional[Path] = None) -> DownloadResult:
+                                  playlist_folder: Optional[Path] = None,
+                                  skip_mkdir: bool = False) -> DownloadResult:
         """
         Search for and download a track from various sources
         
@@ -187,6 +190,7 @@ class AudioDownloader:
             track: Track object to download
             search_engines: List of search engines to use (youtube, soundcloud, etc.)
             playlist_folder: Optional specific folder for playlist-organized downloads
+            skip_mkdir: Skip creating the download folder (caller already created it)
             
         Returns:
             DownloadResult object
@@ -200,7 +204,8 @@ class AudioDownloader:
         
         # Determine download path - use playlist folder if provided, otherwise default
         download_path = playlist_folder if playlist_folder is not None else self.download_path
-        download_path.mkdir(parents=True, exist_ok=True)
+        if not skip_mkdir:
+            download_path.mkdir(parents=True, exist_ok=True)
         
         # Check if file already exists - if so, skip download (ONE FILE PER SONG)
         expected_filename = self.sanitize_filename(f"{track.artist} - {track.title}.mp3")
@@ -241,7 +246,9 @@ class AudioDownloader:
         )
 
     def download_playlist(self, playlist_info, playlist_folder: Path, 
-                         search_engines: Optional[List[str]] = None) -> List[DownloadResult]:
+                         search_engines: Optional[List[str]] = None,
+                         max_workers: int = 1,
+                         cancel_event: Optional[threading.Event] = None) -> List[DownloadResult]:
         """
         Download all tracks from a playlist to a specific folder
         
@@ -249,41 +256,47 @@ class AudioDownloader:
             playlist_info: PlaylistInfo object containing tracks
             playlist_folder: Folder path for the playlist downloads
             search_engines: List of search engines to use
+            max_workers: Number of tracks to download concurrently
+            cancel_event: When set, tracks not yet started are skipped
             
         Returns:
-            List of DownloadResult objects
+            List of DownloadResult objects in playlist order
         """
         from ..utils.config import save_playlist_manifest
         
         # Ensure playlist folder exists
         playlist_folder.mkdir(parents=True, exist_ok=True)
         
-        results = []
-        downloaded_tracks = []
+        tracks = playlist_info.tracks
+        total = len(tracks)
         
-        self.logger.info(f"Starting download of {len(playlist_info.tracks)} tracks to {playlist_folder}")
+        self.logger.info(f"Starting download of {total} tracks to {playlist_folder} ({max_workers} workers)")
         
-        for i, track in enumerate(playlist_info.tracks):
-            self.logger.info(f"Downloading {i+1}/{len(playlist_info.tracks)}: {track.artist} - {track.title}")
-            
-            result = self.search_and_download_track(
+        def download_one(index: int, track: Track) -> DownloadResult:
+            if cancel_event is not None and cancel_event.is_set():
+                return DownloadResult(success=False, track=track, error_message="Download cancelled")
+            self.logger.info(f"Downloading {index+1}/{total}: {track.artist} - {track.title}")
+            return self.search_and_download_track(
                 track, 
                 search_engines=search_engines, 
-                playlist_folder=playlist_folder
+                playlist_folder=playlist_folder,
+                skip_mkdir=True
             )
-            results.append(result)
-            
-            if result.success:
-                downloaded_tracks.append(track)
+        
+        # yt-dlp is blocking I/O, so a thread pool overlaps the network waits
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = list(executor.map(download_one, range(total), tracks))
+        
+        downloaded_tracks = [result.track for result in results if result.success]
         
         # Save playlist manifest with download results
         save_playlist_manifest(playlist_folder, playlist_info, downloaded_tracks)
         
         successful = len(downloaded_tracks)
-        total = len(playlist_info.tracks)
         self.logger.info(f"Playlist download complete: {successful}/{total} tracks downloaded to {playlist_folder}")
         
         return results
+    
     def _download_from_engine(self, track: Track, query: str, engine: str, download_path: Path = None) -> DownloadResult:
         """
         Download from a specific search engine
@@ -360,9 +373,6 @@ class AudioDownloader:
                     # Move file to final destination
                     final_path = download_path / final_filename
                     
-                    # Ensure destination directory exists
-                    final_path.parent.mkdir(parents=True, exist_ok=True)
-                    
                     # Move the file
                     downloaded_file.replace(final_path)
                     
@@ -7,51 +7,263 @@ This module provides the main GUI interface for TTSMixmaster using CustomTkinter
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Set
 import threading
+import queue
+import itertools
 import os
+import re
+import logging
 import json
+import platform
+import shutil
+import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
 
-from ..api.lastfm_client import LastFMAPI, Playlist, Track
-from ..api.base_service import PlaylistInfo
-from ..downloader.audio_downloader import AudioDownloader, DownloadResult
-from ..uploader.azure_uploader import AzureBlobUploader, UploadResult
-from ..tts_formatter.tts_formatter import TTSFormatter, TTSMusicPlayer
-from ..utils.config import ConfigManager, AppConfig, setup_logging
-from .playlist_tab import PlaylistTabManager
+from ..utils.config import (ConfigManager, AppConfig, AZURE_CONNECTION_PLACEHOLDER, setup_logging,
+                            create_playlist_directories, AUDIO_EXTENSIONS)
+
+# Service modules pull in requests, yt-dlp and the Azure SDK; they are imported
+# where first used so the window can appear before those load
+if TYPE_CHECKING:
+    from ..api.lastfm_client import LastFMAPI, Playlist
+    from ..api.base_service import PlaylistInfo
+    from ..downloader.audio_downloader import AudioDownloader, DownloadResult
+    from ..uploader.azure_uploader import AzureBlobUploader, UploadResult
+    from ..tts_formatter.tts_formatter import TTSFormatter, TTSMusicPlayer
+    from .playlist_tab import PlaylistTabManager
+
+
+# Parallel block uploads per file sent to Azure
+_UPLOAD_BLOCK_CONCURRENCY = 4
+
+# Legacy playlist tree header row templates
+_PLAYLIST_HEADER = "Playlist {}: {}"
+_PLAYLIST_COUNT = "{} tracks"
+
+# Minimum interval between results-textbox repaints while workers run (ms)
+_RESULTS_FLUSH_MS = 250
+
+# Results textboxes keep at most this many lines (~2000 result rows)
+_RESULTS_MAX_LINES = 6000
+
+# Interval between progress-bar redraws while workers run (ms)
+_PROGRESS_FLUSH_MS = 50
+
+# Interval between UI-queue drains while worker tasks are in flight (ms)
+_UI_POLL_MS = 50
+
+# Delay used to coalesce bursts of status-bar messages into one redraw (ms)
+_STATUS_FLUSH_MS = 30
+
+# Time running fetches, downloads and uploads get to finish once the window closes (s)
+_EXIT_GRACE_S = 2.0
+
+
+# Platform file-manager launcher, resolved once; Popen so the UI never waits on it
+if platform.system() == "Windows":
+    _open_folder = os.startfile
+elif platform.system() == "Darwin":  # macOS
+    def _open_folder(path):
+        subprocess.Popen(["open", path])
+else:  # Linux
+    def _open_folder(path):
+        subprocess.Popen(["xdg-open", path])
+
+
+# "<width>x<height>" as stored in AppConfig.window_size
+_WINDOW_SIZE_RE = re.compile(r"(\d+)x(\d+)")
+
+# Scripted/CI runs can swap canvas progress bars for cheap text labels
+_NO_PROGRESS_BAR = bool(os.environ.get("TTSMIXMASTER_NO_PROGRESS"))
+
+
+class _TextProgress(ctk.CTkLabel):
+    """Label with the CTkProgressBar set() API, showing progress as a percentage"""
+    
+    def set(self, value: float):
+        """Show a 0.0-1.0 progress value as a percentage"""
+        self.configure(text=f"{int(value * 100)}%")
+
+
+# Parallel file copies when staging downloads for upload
+_COPY_WORKERS = 4
+
+# Record of finished uploads, kept in the upload folder, so re-runs skip unchanged files
+_UPLOAD_MANIFEST = ".uploaded.json"
+
+
+def _link_or_copy(src: Path, dst: Path):
+    """Hard-link src to dst when both share a volume, otherwise copy it"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _read_upload_manifest(path: Path) -> Dict[str, Dict[str, list]]:
+    """Load the upload manifest ({"account/container": {path: [size, mtime_ns, blob, url]}})"""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_upload_manifest(path: Path, manifest: Dict[str, Dict[str, list]]):
+    """Save the upload manifest; a failed write only costs re-uploads on the next run"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(manifest), encoding="utf-8")
+    except OSError:
+        logging.getLogger(__name__).warning("Could not save upload manifest %s", path, exc_info=True)
+
+
+@contextmanager
+def _suspend_wrap(text_widget):
+    """Disable line wrapping on a text widget for the duration of a bulk write"""
+    wrap = text_widget.cget("wrap")
+    text_widget.configure(wrap="none")
+    try:
+        yield text_widget
+    finally:
+        text_widget.configure(wrap=wrap)
 
 
 class TTSMixmasterApp:
     """Main application class for TTSMixmaster GUI"""
     
+    # Combo box choices (CTkComboBox takes lists; built once and shared)
+    _AUDIO_QUALITIES = ["128", "192", "256", "320"]
+    _PLAYLIST_TYPES = ["top_tracks", "loved_tracks", "recent_tracks"]
+    _PERIODS = ["overall", "7day", "1month", "3month", "6month", "12month"]
+    _SEARCH_ENGINES = ["youtube", "soundcloud", "both"]
+    _OUTPUT_FORMATS = ["lua", "json", "save_file", "all"]
+    
+    # Config-tab entries as (AppConfig field, entry attribute), shared by load and save
+    _CONFIG_ENTRIES = (
+        # Last.fm settings
+        ("lastfm_api_key", "lastfm_api_key_entry"),
+        ("lastfm_api_secret", "lastfm_api_secret_entry"),
+        ("lastfm_username", "lastfm_username_entry"),
+        # YouTube settings
+        ("youtube_api_key", "youtube_api_key_entry"),
+        ("youtube_channel_id", "youtube_channel_id_entry"),
+        # Spotify settings
+        ("spotify_client_id", "spotify_client_id_entry"),
+        ("spotify_client_secret", "spotify_client_secret_entry"),
+        ("spotify_user_id", "spotify_user_id_entry"),
+        # Azure settings
+        ("azure_storage_connection_string", "azure_connection_entry"),
+        ("azure_container_name", "azure_container_entry"),
+        # Path settings
+        ("download_path", "download_path_entry"),
+        ("upload_path", "upload_path_entry"),
+        ("tts_output_path", "tts_path_entry"),
+    )
+    
     def __init__(self):
         """Initialize the application"""
-        # Set up configuration
+        # Set up configuration (loaded from disk in _post_init, after first paint)
         self.config_manager = ConfigManager()
-        self.config = self.config_manager.get_config()
+        self.config = AppConfig()
         
-        # Set up logging
-        setup_logging()
-          # Initialize API clients
-        self.lastfm_api = None
-        self.downloader = None
-        self.uploader = None
+        # Initialize API clients (lastfm_api and downloader are built lazily on first use)
+        self.uploader: Optional[AzureBlobUploader] = None
+        self._uploader_key: Optional[tuple] = None
+        self._upload_scope_stale = False  # Azure settings changed; recorded uploads may be gone
         self.formatter = None
+        self._test_lastfm_client: Optional[LastFMAPI] = None
         
         # Data storage
         self.current_playlists: List[Playlist] = []  # Legacy
+        self._playlists_drawn = 0
         self.new_playlists: List[PlaylistInfo] = []  # New format
         self.download_results: List[DownloadResult] = []
         self.upload_results: List[UploadResult] = []
+        self._successful_downloads: List[DownloadResult] = []
+        self._successful_downloads_src: Optional[List[DownloadResult]] = None
+        self._successful_downloads_len = 0
+        self._upload_names: Dict[str, str] = {}
+        self._upload_succ = 0
+        self._upload_fail = 0
+        
+        # Which results list each results textbox shows and how many rows of it are drawn
+        self._upload_drawn_list: Optional[List[UploadResult]] = None
+        self._upload_drawn = 0
+        self._download_drawn_list: Optional[List[DownloadResult]] = None
+        self._download_drawn = 0
+        self._download_succ = 0
+        self._download_fail = 0
+        
+        # Last generated TTS music player (and the inputs it was built from) and preview text
+        self._music_player: Optional[TTSMusicPlayer] = None
+        self._music_player_key: Optional[tuple] = None
+        self._tts_preview_code: Optional[str] = None
+        
+        # Folder the last Browse dialog picked
+        self._last_browse_dir: Optional[str] = None
         
         # Playlist tab manager
         self.playlist_tab_manager: Optional[PlaylistTabManager] = None
         
+        # One reusable worker thread per long-running task; repeat clicks queue behind it
+        self._fetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fetch")
+        self._download_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dl")
+        self._upload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="upload")
+        self._test_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="test")
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+        self._download_future: Optional[Future] = None
+        self._cancel_event = threading.Event()
+        
+        # Submitted tasks not yet finished, and the flag workers check once the window closes
+        self._tasks: Set[Future] = set()
+        self._closing = threading.Event()
+        
         # Initialize GUI
         self._setup_gui()
         
-        # Load configuration
+        # Set up logging and load configuration once the window is up
+        self.root.after(10, self._post_init)
+    
+    @cached_property
+    def lastfm_api(self) -> "LastFMAPI":
+        """Last.fm client for playlist fetching, built from the config on first use"""
+        from ..api.lastfm_client import LastFMAPI
+        return LastFMAPI(
+            self.config.lastfm_api_key,
+            self.config.lastfm_api_secret,
+            self.config.lastfm_username
+        )
+    
+    @cached_property
+    def downloader(self) -> "AudioDownloader":
+        """Audio downloader, built from the config on first use"""
+        from ..downloader.audio_downloader import AudioDownloader
+        return AudioDownloader(
+            self.config.download_path,
+            self.config.audio_quality
+        )
+    
+    def _invalidate_clients(self):
+        """Drop lazily built clients so the next use picks up changed settings"""
+        for name in ("lastfm_api", "downloader"):
+            self.__dict__.pop(name, None)
+    
+    def _post_init(self):
+        """Set up logging and load configuration after the first frame is shown"""
+        setup_logging()
+        self.config = self.config_manager.get_config()
+        
+        # Apply persisted UI settings that differ from the defaults used at startup
+        defaults = AppConfig()
+        if self.config.theme != defaults.theme:
+            ctk.set_appearance_mode(self.config.theme)
+        if self.config.window_size != defaults.window_size:
+            self._apply_window_size()
+        
         self._load_config_to_gui()
         
     def _setup_gui(self):
@@ -64,153 +276,235 @@ class TTSMixmasterApp:
         self.root = ctk.CTk()
         self.root.title("TTSMixmaster - Tabletop Simulator Music Manager")
         
-        # Parse window size
-        try:
-            width, height = map(int, self.config.window_size.split('x'))
-            self.root.geometry(f"{width}x{height}")
-        except:
-            self.root.geometry("1200x800")
+        # Keep the window unmapped while widgets are built so it is laid out and painted once
+        self.root.withdraw()
+        
+        self._apply_window_size()
+        
+        # Shared header fonts (each CTkFont creates a Tk font resource)
+        self._font_h1 = ctk.CTkFont(size=16, weight="bold")
+        self._font_h2 = ctk.CTkFont(size=14, weight="bold")
         
         # Create main frame
         self.main_frame = ctk.CTkFrame(self.root)
         self.main_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
         # Create tabview
-        self.tabview = ctk.CTkTabview(self.main_frame)
+        self.tabview = ctk.CTkTabview(self.main_frame, command=self._on_tab_change)
         self.tabview.pack(fill="both", expand=True, padx=10, pady=10)
-          # Create tabs
+        
+        # Tabs other than Configuration are built on first selection
+        self._tab_builders = {
+            "Collections & Playlists": self._create_new_playlist_tab,
+            "Download": self._create_download_tab,
+            "Upload": self._create_upload_tab,
+            "TTS Format": self._create_format_tab,
+        }
+        self._tabs_built = set()
+        
+        self.tabview.add("Configuration")
+        for name in self._tab_builders:
+            self.tabview.add(name)
+        
+        # Create tabs
         self._create_config_tab()
-        self._create_new_playlist_tab()  # New playlist tab
-        self._create_download_tab()
-        self._create_upload_tab()
-        self._create_format_tab()
+        self._tabs_built.add("Configuration")
         
         # Create status bar
         self._create_status_bar()
+        self._status_pending: Optional[str] = None
+        self._status_scheduled = False
+        
+        # Worker threads hand UI calls to the Tk thread through this queue; the Tk thread
+        # polls it only while tracked tasks are in flight
+        self._ui_queue = queue.Queue()
+        self._ui_poll_scheduled = False
+        
+        # Workers flag results as dirty; the Tk thread repaints at most every _RESULTS_FLUSH_MS
+        self._download_results_dirty = False
+        self._upload_results_dirty = False
+        self._results_flush_scheduled = False
+        
+        # Workers publish the latest progress value; the Tk thread draws it if it changed
+        self._download_progress_pending: Optional[float] = None
+        self._upload_progress_pending: Optional[float] = None
+        self._download_progress_shown: Optional[float] = None
+        self._upload_progress_shown: Optional[float] = None
+        self._progress_flush_scheduled = False
+        
+        # Settle geometry for the whole widget tree, then map the window once
+        self.root.update_idletasks()
+        self.root.deiconify()
+    
+    def _run_on_ui(self, func, *args, **kwargs):
+        """Schedule a callable to run on the Tk thread (safe to call from workers)"""
+        self._ui_queue.put(lambda: func(*args, **kwargs))
+        # Workers never touch Tk; a call from the Tk thread itself starts the poll directly
+        if threading.current_thread() is threading.main_thread():
+            self._poll_ui_queue()
+    
+    def _poll_ui_queue(self):
+        """Schedule the next UI-queue drain unless one is pending (Tk thread only)"""
+        if not self._ui_poll_scheduled:
+            self._ui_poll_scheduled = True
+            self.root.after(_UI_POLL_MS, self._drain_ui_queue)
+    
+    def _drain_ui_queue(self):
+        """Run queued UI callables on the Tk thread, polling again while tasks are in flight"""
+        self._ui_poll_scheduled = False
+        try:
+            while True:
+                callback = self._ui_queue.get_nowait()
+                try:
+                    callback()
+                except Exception:
+                    logging.exception("Error running UI callback")
+        except queue.Empty:
+            pass
+        
+        # A task leaves _tasks only after its own done callbacks have queued their UI calls
+        if self._tasks or not self._ui_queue.empty():
+            self._poll_ui_queue()
+    
+    def _track_task(self, future: Future) -> Future:
+        """Track a submitted future and keep the UI queue polled until it is done (Tk thread only)"""
+        self._tasks.add(future)
+        future.add_done_callback(self._tasks.discard)
+        self._poll_ui_queue()
+        return future
+    
+    def _mark_results_dirty(self):
+        """Request a throttled results repaint (safe to call from workers)"""
+        if not self._results_flush_scheduled:
+            self._run_on_ui(self._schedule_results_flush)
+    
+    def _schedule_results_flush(self):
+        """Schedule a results repaint unless one is already pending"""
+        if not self._results_flush_scheduled:
+            self._results_flush_scheduled = True
+            self.root.after(_RESULTS_FLUSH_MS, self._flush_results)
+    
+    def _flush_results(self):
+        """Repaint results textboxes flagged dirty by workers"""
+        self._results_flush_scheduled = False
+        try:
+            if self._download_results_dirty:
+                self._download_results_dirty = False
+                self._update_download_results()
+            if self._upload_results_dirty:
+                self._upload_results_dirty = False
+                self._update_upload_results()
+        except Exception:
+            logging.exception("Error refreshing results")
+    
+    def _mark_progress_dirty(self):
+        """Request a progress-bar redraw (safe to call from workers)"""
+        if not self._progress_flush_scheduled:
+            self._run_on_ui(self._schedule_progress_flush)
+    
+    def _schedule_progress_flush(self):
+        """Schedule a progress-bar redraw unless one is already pending"""
+        if not self._progress_flush_scheduled:
+            self._progress_flush_scheduled = True
+            self.root.after(_PROGRESS_FLUSH_MS, self._flush_progress)
+    
+    def _flush_progress(self):
+        """Apply the latest pending progress values to the progress bars"""
+        self._progress_flush_scheduled = False
+        try:
+            value = self._download_progress_pending
+            if value is not None and value != self._download_progress_shown:
+                self._download_progress_shown = value
+                self.download_progress.set(value)
+            value = self._upload_progress_pending
+            if value is not None and value != self._upload_progress_shown:
+                self._upload_progress_shown = value
+                self.upload_progress.set(value)
+        except Exception:
+            logging.exception("Error refreshing progress")
+    
+    def _apply_window_size(self):
+        """Apply the configured window size to the root window"""
+        # Parse window size
+        match = _WINDOW_SIZE_RE.fullmatch(self.config.window_size or "")
+        if match:
+            self.root.geometry(f"{match[1]}x{match[2]}")
+        else:
+            self.root.geometry("1200x800")
+    
+    def _on_tab_change(self):
+        """Build the selected tab's widgets the first time it is shown"""
+        name = self.tabview.get()
+        if name in self._tabs_built:
+            return
+        builder = self._tab_builders.get(name)
+        if builder:
+            self._tabs_built.add(name)
+            builder()
     
     def _create_config_tab(self):
         """Create configuration tab"""
-        tab = self.tabview.add("Configuration")
+        tab = self.tabview.tab("Configuration")
         
         # API Configuration Frame
         api_frame = ctk.CTkFrame(tab)
         api_frame.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkLabel(api_frame, text="API Configuration", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
-        
-        # Last.fm API settings
-        lastfm_frame = ctk.CTkFrame(api_frame)
-        lastfm_frame.pack(fill="x", padx=10, pady=5)
-        
-        ctk.CTkLabel(lastfm_frame, text="Last.fm Settings").pack(anchor="w", padx=5, pady=2)
-        
-        self.lastfm_api_key_entry = ctk.CTkEntry(lastfm_frame, placeholder_text="Last.fm API Key")
-        self.lastfm_api_key_entry.pack(fill="x", padx=5, pady=2)        
-        self.lastfm_api_secret_entry = ctk.CTkEntry(lastfm_frame, placeholder_text="Last.fm API Secret")
-        self.lastfm_api_secret_entry.pack(fill="x", padx=5, pady=2)
-        
-        self.lastfm_username_entry = ctk.CTkEntry(lastfm_frame, placeholder_text="Last.fm Username")
-        self.lastfm_username_entry.pack(fill="x", padx=5, pady=2)
-        
-        # YouTube API settings
-        youtube_frame = ctk.CTkFrame(api_frame)
-        youtube_frame.pack(fill="x", padx=10, pady=5)
-        
-        ctk.CTkLabel(youtube_frame, text="YouTube Settings").pack(anchor="w", padx=5, pady=2)
-        
-        self.youtube_api_key_entry = ctk.CTkEntry(youtube_frame, placeholder_text="YouTube Data API v3 Key")
-        self.youtube_api_key_entry.pack(fill="x", padx=5, pady=2)
-        
-        self.youtube_channel_id_entry = ctk.CTkEntry(youtube_frame, placeholder_text="YouTube Channel ID (optional)")
-        self.youtube_channel_id_entry.pack(fill="x", padx=5, pady=2)
-        
-        # Spotify API settings
-        spotify_frame = ctk.CTkFrame(api_frame)
-        spotify_frame.pack(fill="x", padx=10, pady=5)
-        
-        ctk.CTkLabel(spotify_frame, text="Spotify Settings").pack(anchor="w", padx=5, pady=2)
-        
-        self.spotify_client_id_entry = ctk.CTkEntry(spotify_frame, placeholder_text="Spotify Client ID")
-        self.spotify_client_id_entry.pack(fill="x", padx=5, pady=2)
-        
-        self.spotify_client_secret_entry = ctk.CTkEntry(spotify_frame, placeholder_text="Spotify Client Secret", show="*")
-        self.spotify_client_secret_entry.pack(fill="x", padx=5, pady=2)
-        
-        self.spotify_user_id_entry = ctk.CTkEntry(spotify_frame, placeholder_text="Spotify User ID (optional)")
-        self.spotify_user_id_entry.pack(fill="x", padx=5, pady=2)
-        
-        # Azure Storage settings
-        azure_frame = ctk.CTkFrame(api_frame)
-        azure_frame.pack(fill="x", padx=10, pady=5)
-        
-        ctk.CTkLabel(azure_frame, text="Azure Storage Settings").pack(anchor="w", padx=5, pady=2)
-        
-        self.azure_connection_entry = ctk.CTkEntry(azure_frame, placeholder_text="Azure Storage Connection String", show="*")
-        self.azure_connection_entry.pack(fill="x", padx=5, pady=2)
-        
-        self.azure_container_entry = ctk.CTkEntry(azure_frame, placeholder_text="Container Name (default: tts-audio)")
-        self.azure_container_entry.pack(fill="x", padx=5, pady=2)
+        ctk.CTkLabel(api_frame, text="API Configuration", font=self._font_h1).pack(pady=5)
+        
+        # Credential sections: (title, [(entry attribute, placeholder, show), ...])
+        sections = (
+            ("Last.fm Settings", (
+                ("lastfm_api_key_entry", "Last.fm API Key", ""),
+                ("lastfm_api_secret_entry", "Last.fm API Secret", ""),
+                ("lastfm_username_entry", "Last.fm Username", ""),
+            )),
+            ("YouTube Settings", (
+                ("youtube_api_key_entry", "YouTube Data API v3 Key", ""),
+                ("youtube_channel_id_entry", "YouTube Channel ID (optional)", ""),
+            )),
+            ("Spotify Settings", (
+                ("spotify_client_id_entry", "Spotify Client ID", ""),
+                ("spotify_client_secret_entry", "Spotify Client Secret", "*"),
+                ("spotify_user_id_entry", "Spotify User ID (optional)", ""),
+            )),
+            ("Azure Storage Settings", (
+                ("azure_connection_entry", "Azure Storage Connection String", "*"),
+                ("azure_container_entry", "Container Name (default: tts-audio)", ""),
+            )),
+        )
+        # One grid holds every section instead of a packed sub-frame per service
+        fields_frame = ctk.CTkFrame(api_frame)
+        fields_frame.pack(fill="x", padx=10, pady=5)
+        fields_frame.grid_columnconfigure(0, weight=1)
+        
+        row = 0
+        for title, fields in sections:
+            row = self._create_settings_section(fields_frame, title, fields, row)
         
         # Path Configuration Frame
         path_frame = ctk.CTkFrame(tab)
         path_frame.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkLabel(path_frame, text="Path Configuration", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
-        
-        # Download path
-        download_frame = ctk.CTkFrame(path_frame)
-        download_frame.pack(fill="x", padx=10, pady=2)
-        
-        ctk.CTkLabel(download_frame, text="Download Path:").pack(anchor="w", padx=5)
-        path_inner_frame = ctk.CTkFrame(download_frame)
-        path_inner_frame.pack(fill="x", padx=5, pady=2)
-        
-        self.download_path_entry = ctk.CTkEntry(path_inner_frame)
-        self.download_path_entry.pack(side="left", fill="x", expand=True, padx=2)
-        
-        ctk.CTkButton(path_inner_frame, text="Browse", width=80,
-                     command=lambda: self._browse_folder(self.download_path_entry)).pack(side="right", padx=2)
-        
-        # Upload path
-        upload_frame = ctk.CTkFrame(path_frame)
-        upload_frame.pack(fill="x", padx=10, pady=2)
-        
-        ctk.CTkLabel(upload_frame, text="Upload Path:").pack(anchor="w", padx=5)
-        path_inner_frame2 = ctk.CTkFrame(upload_frame)
-        path_inner_frame2.pack(fill="x", padx=5, pady=2)
+        ctk.CTkLabel(path_frame, text="Path Configuration", font=self._font_h1).pack(pady=5)
         
-        self.upload_path_entry = ctk.CTkEntry(path_inner_frame2)
-        self.upload_path_entry.pack(side="left", fill="x", expand=True, padx=2)
-        
-        ctk.CTkButton(path_inner_frame2, text="Browse", width=80,
-                     command=lambda: self._browse_folder(self.upload_path_entry)).pack(side="right", padx=2)
-        
-        # TTS output path
-        tts_frame = ctk.CTkFrame(path_frame)
-        tts_frame.pack(fill="x", padx=10, pady=2)
-        
-        ctk.CTkLabel(tts_frame, text="TTS Output Path:").pack(anchor="w", padx=5)
-        path_inner_frame3 = ctk.CTkFrame(tts_frame)
-        path_inner_frame3.pack(fill="x", padx=5, pady=2)
-        
-        self.tts_path_entry = ctk.CTkEntry(path_inner_frame3)
-        self.tts_path_entry.pack(side="left", fill="x", expand=True, padx=2)
-        
-        ctk.CTkButton(path_inner_frame3, text="Browse", width=80,
-                     command=lambda: self._browse_folder(self.tts_path_entry)).pack(side="right", padx=2)
+        # Path rows
+        self.download_path_entry = self._create_path_row(path_frame, "Download Path:")
+        self.upload_path_entry = self._create_path_row(path_frame, "Upload Path:")
+        self.tts_path_entry = self._create_path_row(path_frame, "TTS Output Path:")
         
         # Audio Settings Frame
         audio_frame = ctk.CTkFrame(tab)
         audio_frame.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkLabel(audio_frame, text="Audio Settings", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+        ctk.CTkLabel(audio_frame, text="Audio Settings", font=self._font_h1).pack(pady=5)
         
         quality_frame = ctk.CTkFrame(audio_frame)
         quality_frame.pack(fill="x", padx=10, pady=5)
         
         ctk.CTkLabel(quality_frame, text="Audio Quality:").pack(side="left", padx=5)
         self.audio_quality_var = ctk.StringVar(value="192")
-        self.audio_quality_combo = ctk.CTkComboBox(quality_frame, values=["128", "192", "256", "320"],
+        self.audio_quality_combo = ctk.CTkComboBox(quality_frame, values=self._AUDIO_QUALITIES,
                                                   variable=self.audio_quality_var)
         self.audio_quality_combo.pack(side="left", padx=5)
         
@@ -218,24 +512,71 @@ class TTSMixmasterApp:
         button_frame = ctk.CTkFrame(tab)
         button_frame.pack(fill="x", padx=10, pady=10)
         
-        ctk.CTkButton(button_frame, text="Save Configuration", command=self._save_config).pack(side="left", padx=5)
-        ctk.CTkButton(button_frame, text="Test Last.fm Connection", command=self._test_lastfm_connection).pack(side="left", padx=5)
-        ctk.CTkButton(button_frame, text="Test YouTube Connection", command=self._test_youtube_connection).pack(side="left", padx=5)
-        ctk.CTkButton(button_frame, text="Test Spotify Connection", command=self._test_spotify_connection).pack(side="left", padx=5)
-        ctk.CTkButton(button_frame, text="Test Azure Connection", command=self._test_azure_connection).pack(side="left", padx=5)
+        buttons = (
+            ("Save Configuration", self._save_config),
+            ("Test Last.fm Connection", self._test_lastfm_connection),
+            ("Test YouTube Connection", self._test_youtube_connection),
+            ("Test Spotify Connection", self._test_spotify_connection),
+            ("Test Azure Connection", self._test_azure_connection),
+        )
+        for text, command in buttons:
+            ctk.CTkButton(button_frame, text=text, command=command).pack(side="left", padx=5)
+    
+    def _create_settings_section(self, parent, title: str, fields, row: int) -> int:
+        """Grid a titled block of credential entries from row, storing each entry on self; return the next free row"""
+        ctk.CTkLabel(parent, text=title).grid(row=row, column=0, sticky="w", padx=5, pady=(8, 2))
+        
+        for attr, placeholder, show in fields:
+            row += 1
+            entry = ctk.CTkEntry(parent, placeholder_text=placeholder, show=show)
+            entry.grid(row=row, column=0, sticky="ew", padx=5, pady=2)
+            setattr(self, attr, entry)
+        
+        return row + 1
+    
+    def _create_path_row(self, parent, label: str) -> ctk.CTkEntry:
+        """Create a single-frame label/entry/browse row and return the entry"""
+        row = ctk.CTkFrame(parent)
+        row.pack(fill="x", padx=10, pady=2)
+        row.grid_columnconfigure(1, weight=1)
+        
+        ctk.CTkLabel(row, text=label).grid(row=0, column=0, sticky="w", padx=5, pady=2)
+        
+        entry = ctk.CTkEntry(row)
+        entry.grid(row=0, column=1, sticky="ew", padx=4, pady=2)
+        
+        ctk.CTkButton(row, text="Browse", width=80,
+                     command=lambda: self._browse_folder(entry)).grid(row=0, column=2, padx=2, pady=2)
+        
+        return entry
+    
+    def _create_progress_bar(self, parent):
+        """Create a progress bar, or a percentage label when TTSMIXMASTER_NO_PROGRESS is set"""
+        if _NO_PROGRESS_BAR:
+            progress = _TextProgress(parent, text="0%")
+        else:
+            progress = ctk.CTkProgressBar(parent)
+        progress.pack(fill="x", padx=10, pady=5)
+        return progress
+    
+    def _create_log_textbox(self, parent, wrap: str = "char") -> ctk.CTkTextbox:
+        """Create a packed, program-filled textbox with Tk's undo bookkeeping switched off"""
+        textbox = ctk.CTkTextbox(parent, wrap=wrap, undo=False, autoseparators=False, maxundo=0)
+        textbox.pack(fill="both", expand=True, padx=5, pady=5)
+        return textbox
     
     def _create_new_playlist_tab(self):
         """Create the new multi-service playlist tab"""
         try:
-            tab = self.tabview.add("Collections & Playlists")
+            tab = self.tabview.tab("Collections & Playlists")
+            from .playlist_tab import PlaylistTabManager
             self.playlist_tab_manager = PlaylistTabManager(tab, self.config_manager, self)
-        except Exception as e:
-            print(f"Error initializing playlist tab manager: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logging.getLogger(__name__).exception("Error initializing playlist tab manager")
             self.playlist_tab_manager = None
     
-    # Legacy playlist tab (keeping for now for backwards compatibility)
+    # Legacy playlist tab (keeping for now for backwards compatibility); nothing calls it,
+    # so this view and its fetch/display helpers are currently unreachable
     def _create_playlist_tab(self):
         """Create playlist management tab"""
         tab = self.tabview.add("Playlists")
@@ -244,7 +585,7 @@ class TTSMixmasterApp:
         controls_frame = ctk.CTkFrame(tab)
         controls_frame.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkLabel(controls_frame, text="Playlist Management", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+        ctk.CTkLabel(controls_frame, text="Playlist Management", font=self._font_h1).pack(pady=5)
         
         # Playlist type selection
         type_frame = ctk.CTkFrame(controls_frame)
@@ -252,22 +593,20 @@ class TTSMixmasterApp:
         
         ctk.CTkLabel(type_frame, text="Playlist Type:").pack(side="left", padx=5)
         self.playlist_type_var = ctk.StringVar(value="top_tracks")
-        playlist_types = ["top_tracks", "loved_tracks", "recent_tracks"]
-        self.playlist_type_combo = ctk.CTkComboBox(type_frame, values=playlist_types,
+        self.playlist_type_combo = ctk.CTkComboBox(type_frame, values=self._PLAYLIST_TYPES,
                                                   variable=self.playlist_type_var)
         self.playlist_type_combo.pack(side="left", padx=5)
         
         # Period selection (for top tracks)
         ctk.CTkLabel(type_frame, text="Period:").pack(side="left", padx=(20, 5))
         self.period_var = ctk.StringVar(value="overall")
-        periods = ["overall", "7day", "1month", "3month", "6month", "12month"]
-        self.period_combo = ctk.CTkComboBox(type_frame, values=periods, variable=self.period_var)
+        self.period_combo = ctk.CTkComboBox(type_frame, values=self._PERIODS, variable=self.period_var)
         self.period_combo.pack(side="left", padx=5)
         
         # Limit selection
         ctk.CTkLabel(type_frame, text="Limit:").pack(side="left", padx=(20, 5))
-        self.limit_var = ctk.StringVar(value="50")
-        self.limit_entry = ctk.CTkEntry(type_frame, width=60, textvariable=self.limit_var)
+        self.limit_entry = ctk.CTkEntry(type_frame, width=60)
+        self.limit_entry.insert(0, "50")
         self.limit_entry.pack(side="left", padx=5)
         
         # Action buttons
@@ -281,26 +620,31 @@ class TTSMixmasterApp:
         display_frame = ctk.CTkFrame(tab)
         display_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
-        ctk.CTkLabel(display_frame, text="Current Playlists", font=ctk.CTkFont(size=14, weight="bold")).pack(pady=5)
+        ctk.CTkLabel(display_frame, text="Current Playlists", font=self._font_h2).pack(pady=5)
         
         # Create treeview for playlists
         tree_frame = ctk.CTkFrame(display_frame)
         tree_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
-        # Note: CustomTkinter doesn't have a direct treeview equivalent
-        # Using a text widget for now, can be enhanced with a proper table widget
-        self.playlist_text = ctk.CTkTextbox(tree_frame)
-        self.playlist_text.pack(fill="both", expand=True, padx=5, pady=5)
+        # Treeview only draws the visible rows, unlike a full text widget repaint
+        self.playlist_tree = ttk.Treeview(tree_frame, columns=("#", "Artist", "Title"), show="headings")
+        self.playlist_tree.heading("#", text="#")
+        self.playlist_tree.heading("Artist", text="Artist")
+        self.playlist_tree.heading("Title", text="Title")
+        self.playlist_tree.column("#", width=40, anchor="center")
+        self.playlist_tree.column("Artist", width=200)
+        self.playlist_tree.column("Title", width=400)
+        self.playlist_tree.pack(fill="both", expand=True, padx=5, pady=5)
     
     def _create_download_tab(self):
         """Create download management tab"""
-        tab = self.tabview.add("Download")
+        tab = self.tabview.tab("Download")
         
         # Controls frame
         controls_frame = ctk.CTkFrame(tab)
         controls_frame.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkLabel(controls_frame, text="Audio Download", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+        ctk.CTkLabel(controls_frame, text="Audio Download", font=self._font_h1).pack(pady=5)
         
         # Download options
         options_frame = ctk.CTkFrame(controls_frame)
@@ -308,8 +652,7 @@ class TTSMixmasterApp:
         
         ctk.CTkLabel(options_frame, text="Search Engine:").pack(side="left", padx=5)
         self.search_engine_var = ctk.StringVar(value="youtube")
-        engines = ["youtube", "soundcloud", "both"]
-        self.search_engine_combo = ctk.CTkComboBox(options_frame, values=engines,
+        self.search_engine_combo = ctk.CTkComboBox(options_frame, values=self._SEARCH_ENGINES,
                                                   variable=self.search_engine_var)
         self.search_engine_combo.pack(side="left", padx=5)
         
@@ -326,8 +669,7 @@ class TTSMixmasterApp:
         
         ctk.CTkLabel(progress_frame, text="Download Progress").pack(pady=5)
         
-        self.download_progress = ctk.CTkProgressBar(progress_frame)
-        self.download_progress.pack(fill="x", padx=10, pady=5)
+        self.download_progress = self._create_progress_bar(progress_frame)
         
         self.download_status_label = ctk.CTkLabel(progress_frame, text="Ready to download")
         self.download_status_label.pack(pady=5)
@@ -336,31 +678,33 @@ class TTSMixmasterApp:
         results_frame = ctk.CTkFrame(tab)
         results_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
-        ctk.CTkLabel(results_frame, text="Download Results", font=ctk.CTkFont(size=14, weight="bold")).pack(pady=5)
+        ctk.CTkLabel(results_frame, text="Download Results", font=self._font_h2).pack(pady=5)
         
-        self.download_results_text = ctk.CTkTextbox(results_frame)
-        self.download_results_text.pack(fill="both", expand=True, padx=5, pady=5)
+        self.download_results_text = self._create_log_textbox(results_frame)
     
     def _create_upload_tab(self):
         """Create upload management tab"""
-        tab = self.tabview.add("Upload")
+        tab = self.tabview.tab("Upload")
         
         # Controls frame
         controls_frame = ctk.CTkFrame(tab)
         controls_frame.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkLabel(controls_frame, text="Azure Blob Storage Upload", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+        ctk.CTkLabel(controls_frame, text="Azure Blob Storage Upload", font=self._font_h1).pack(pady=5)
         
         # Upload options
         options_frame = ctk.CTkFrame(controls_frame)
         options_frame.pack(fill="x", padx=10, pady=5)
         
         ctk.CTkLabel(options_frame, text="Title Prefix:").pack(side="left", padx=5)
-        self.title_prefix_var = ctk.StringVar()
-        self.title_prefix_entry = ctk.CTkEntry(options_frame, textvariable=self.title_prefix_var,
+        self.title_prefix_entry = ctk.CTkEntry(options_frame,
                                               placeholder_text="Optional prefix for item titles")
         self.title_prefix_entry.pack(side="left", fill="x", expand=True, padx=5)
         
+        # Ignore the upload manifest, e.g. after blobs were deleted or the container recreated
+        self.force_upload_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(options_frame, text="Re-upload all", variable=self.force_upload_var).pack(side="left", padx=5)
+        
         # Action buttons
         button_frame = ctk.CTkFrame(controls_frame)
         button_frame.pack(fill="x", padx=10, pady=5)        
@@ -374,8 +718,7 @@ class TTSMixmasterApp:
         
         ctk.CTkLabel(progress_frame, text="Upload Progress").pack(pady=5)
         
-        self.upload_progress = ctk.CTkProgressBar(progress_frame)
-        self.upload_progress.pack(fill="x", padx=10, pady=5)
+        self.upload_progress = self._create_progress_bar(progress_frame)
         
         self.upload_status_label = ctk.CTkLabel(progress_frame, text="Ready to upload")
         self.upload_status_label.pack(pady=5)
@@ -383,20 +726,19 @@ class TTSMixmasterApp:
         # Results frame
         results_frame = ctk.CTkFrame(tab)
         results_frame.pack(fill="both", expand=True, padx=10, pady=5)        
-        ctk.CTkLabel(results_frame, text="Upload Results", font=ctk.CTkFont(size=14, weight="bold")).pack(pady=5)
+        ctk.CTkLabel(results_frame, text="Upload Results", font=self._font_h2).pack(pady=5)
         
-        self.upload_results_text = ctk.CTkTextbox(results_frame)
-        self.upload_results_text.pack(fill="both", expand=True, padx=5, pady=5)
+        self.upload_results_text = self._create_log_textbox(results_frame)
     
     def _create_format_tab(self):
         """Create TTS formatting tab"""
-        tab = self.tabview.add("TTS Format")
+        tab = self.tabview.tab("TTS Format")
         
         # Controls frame
         controls_frame = ctk.CTkFrame(tab)
         controls_frame.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkLabel(controls_frame, text="Tabletop Simulator Formatting", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+        ctk.CTkLabel(controls_frame, text="Tabletop Simulator Formatting", font=self._font_h1).pack(pady=5)
         
         # Format options
         options_frame = ctk.CTkFrame(controls_frame)
@@ -408,8 +750,7 @@ class TTSMixmasterApp:
         
         ctk.CTkLabel(format_row, text="Output Format:").pack(side="left", padx=5)
         self.output_format_var = ctk.StringVar(value="save_file")
-        formats = ["lua", "json", "save_file", "all"]
-        self.output_format_combo = ctk.CTkComboBox(format_row, values=formats,
+        self.output_format_combo = ctk.CTkComboBox(format_row, values=self._OUTPUT_FORMATS,
                                                   variable=self.output_format_var)
         self.output_format_combo.pack(side="left", padx=5)
         
@@ -423,15 +764,14 @@ class TTSMixmasterApp:
         custom_frame = ctk.CTkFrame(controls_frame)
         custom_frame.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkLabel(custom_frame, text="TTS Object Customization", font=ctk.CTkFont(size=14, weight="bold")).pack(pady=5)
+        ctk.CTkLabel(custom_frame, text="TTS Object Customization", font=self._font_h2).pack(pady=5)
         
         # Nickname field
         nickname_row = ctk.CTkFrame(custom_frame)
         nickname_row.pack(fill="x", pady=2)
         
         ctk.CTkLabel(nickname_row, text="Nickname:", width=100).pack(side="left", padx=5)
-        self.tts_nickname_var = ctk.StringVar()
-        self.tts_nickname_entry = ctk.CTkEntry(nickname_row, textvariable=self.tts_nickname_var,
+        self.tts_nickname_entry = ctk.CTkEntry(nickname_row,
                                               placeholder_text="Object nickname (uses playlist name if empty)")
         self.tts_nickname_entry.pack(side="left", fill="x", expand=True, padx=5)
           # Description field
@@ -439,8 +779,7 @@ class TTSMixmasterApp:
         desc_row.pack(fill="x", pady=2)
         
         ctk.CTkLabel(desc_row, text="Description:", width=100).pack(side="left", padx=5)
-        self.tts_description_var = ctk.StringVar()
-        self.tts_description_entry = ctk.CTkEntry(desc_row, textvariable=self.tts_description_var,
+        self.tts_description_entry = ctk.CTkEntry(desc_row,
                                                  placeholder_text="Object description (auto-generated if empty)")
         self.tts_description_entry.pack(side="left", fill="x", expand=True, padx=5)
         
@@ -475,10 +814,10 @@ class TTSMixmasterApp:
         preview_frame = ctk.CTkFrame(tab)
         preview_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
-        ctk.CTkLabel(preview_frame, text="Generated Code Preview", font=ctk.CTkFont(size=14, weight="bold")).pack(pady=5)
+        ctk.CTkLabel(preview_frame, text="Generated Code Preview", font=self._font_h2).pack(pady=5)
         
-        self.tts_preview_text = ctk.CTkTextbox(preview_frame)
-        self.tts_preview_text.pack(fill="both", expand=True, padx=5, pady=5)
+        # Generated code reads better unwrapped, and skips wrap reflow on long scripts
+        self.tts_preview_text = self._create_log_textbox(preview_frame, wrap="none")
     
     def _create_status_bar(self):
         """Create status bar"""
@@ -494,65 +833,35 @@ class TTSMixmasterApp:
     
     def _load_config_to_gui(self):
         """Load configuration values to GUI elements"""
-        # Last.fm settings
-        self.lastfm_api_key_entry.insert(0, self.config.lastfm_api_key)
-        self.lastfm_api_secret_entry.insert(0, self.config.lastfm_api_secret)
-        self.lastfm_username_entry.insert(0, self.config.lastfm_username)
-        
-        # YouTube settings
-        self.youtube_api_key_entry.insert(0, self.config.youtube_api_key)
-        self.youtube_channel_id_entry.insert(0, self.config.youtube_channel_id)
-        
-        # Spotify settings
-        self.spotify_client_id_entry.insert(0, self.config.spotify_client_id)
-        self.spotify_client_secret_entry.insert(0, self.config.spotify_client_secret)
-        self.spotify_user_id_entry.insert(0, self.config.spotify_user_id)
-        
-        # Azure settings
-        self.azure_connection_entry.insert(0, self.config.azure_storage_connection_string)
-        self.azure_container_entry.insert(0, self.config.azure_container_name)
+        config = self.config
         
-        # Path settings
-        self.download_path_entry.insert(0, self.config.download_path)
-        self.upload_path_entry.insert(0, self.config.upload_path)
-        self.tts_path_entry.insert(0, self.config.tts_output_path)
+        # Skip empty values: inserting "" costs a Tcl round-trip and hides the placeholder
+        for key, attr in self._CONFIG_ENTRIES:
+            value = getattr(config, key)
+            if value:
+                getattr(self, attr).insert(0, value)
         
         # Audio settings
-        self.audio_quality_var.set(self.config.audio_quality)
+        self.audio_quality_var.set(config.audio_quality)
     
     def _browse_folder(self, entry_widget):
         """Browse for folder and update entry widget"""
-        folder = filedialog.askdirectory()
+        # Start from the last picked folder, else the entry's current path
+        initialdir = self._last_browse_dir or entry_widget.get() or os.path.expanduser("~")
+        folder = filedialog.askdirectory(initialdir=initialdir)
         if folder:
+            self._last_browse_dir = folder
             entry_widget.delete(0, tk.END)
             entry_widget.insert(0, folder)
     
     def _save_config(self):
         """Save configuration from GUI"""
         try:
-            self.config_manager.update_config(
-                # Last.fm settings
-                lastfm_api_key=self.lastfm_api_key_entry.get(),
-                lastfm_api_secret=self.lastfm_api_secret_entry.get(),
-                lastfm_username=self.lastfm_username_entry.get(),
-                # YouTube settings
-                youtube_api_key=self.youtube_api_key_entry.get(),
-                youtube_channel_id=self.youtube_channel_id_entry.get(),
-                # Spotify settings
-                spotify_client_id=self.spotify_client_id_entry.get(),
-                spotify_client_secret=self.spotify_client_secret_entry.get(),
-                spotify_user_id=self.spotify_user_id_entry.get(),
-                # Azure settings
-                azure_storage_connection_string=self.azure_connection_entry.get(),
-                azure_container_name=self.azure_container_entry.get(),
-                # Path settings
-                download_path=self.download_path_entry.get(),
-                upload_path=self.upload_path_entry.get(),
-                tts_output_path=self.tts_path_entry.get(),
-                # Audio settings
-                audio_quality=self.audio_quality_var.get()            )
+            values = {key: getattr(self, attr).get() for key, attr in self._CONFIG_ENTRIES}
+            self.config_manager.update_config(audio_quality=self.audio_quality_var.get(), **values)
             
             self.config = self.config_manager.get_config()
+            self._invalidate_clients()
             
             # Reinitialize services in playlist tab manager
             if self.playlist_tab_manager:
@@ -566,131 +875,144 @@ class TTSMixmasterApp:
     
     def _test_lastfm_connection(self):
         """Test Last.fm API connection"""
-        try:
-            api_key = self.lastfm_api_key_entry.get()
-            username = self.lastfm_username_entry.get()
-            
-            if not api_key or not username:
-                messagebox.showwarning("Warning", "Please enter API key and username")
-                return
-            
-            # Create temporary API client
-            api = LastFMAPI(api_key, username=username)
-            
-            # Test by getting user info
-            tracks = api.get_user_recent_tracks(username, limit=1)
-            
-            messagebox.showinfo("Success", f"Connected successfully! Found {len(tracks)} recent tracks.")
-            self._update_status("Last.fm connection successful")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to connect to Last.fm: {e}")
+        api_key = self.lastfm_api_key_entry.get()
+        username = self.lastfm_username_entry.get()
+        
+        if not api_key or not username:
+            messagebox.showwarning("Warning", "Please enter API key and username")
+            return
+        
+        def test_worker():
+            try:
+                # Reuse the test client (and its HTTP session) while the key is unchanged
+                api = self._test_lastfm_client
+                if api is None or api.api_key != api_key:
+                    from ..api.lastfm_client import LastFMAPI
+                    api = LastFMAPI(api_key, username=username)
+                    self._test_lastfm_client = api
+                api.username = username
+                
+                # Test by getting user info
+                tracks = api.get_user_recent_tracks(username, limit=1)
+                
+                self._run_on_ui(messagebox.showinfo, "Success", f"Connected successfully! Found {len(tracks)} recent tracks.")
+                self._run_on_ui(self._update_status, "Last.fm connection successful")
+                
+            except Exception as e:
+                self._run_on_ui(messagebox.showerror, "Error", f"Failed to connect to Last.fm: {e}")
+        
+        self._update_status("Testing Last.fm connection...")
+        self._submit_task(self._test_executor, test_worker)
     
     def _test_youtube_connection(self):
         """Test YouTube API connection"""
-        try:
-            api_key = self.youtube_api_key_entry.get()
-            
-            if not api_key:
-                messagebox.showwarning("Warning", "Please enter YouTube API key")
-                return
-            
-            from ..api.youtube_service import YouTubeService
-            service = YouTubeService(api_key)
-            
-            if service.test_connection():
-                messagebox.showinfo("Success", "YouTube connection successful!")
-                self._update_status("YouTube connection successful")
-            else:
-                messagebox.showerror("Error", "Failed to connect to YouTube API")
+        api_key = self.youtube_api_key_entry.get()
+        
+        if not api_key:
+            messagebox.showwarning("Warning", "Please enter YouTube API key")
+            return
+        
+        def test_worker():
+            try:
+                from ..api.youtube_service import YouTubeService
+                service = YouTubeService(api_key)
                 
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to test YouTube connection: {e}")
+                if service.test_connection():
+                    self._run_on_ui(messagebox.showinfo, "Success", "YouTube connection successful!")
+                    self._run_on_ui(self._update_status, "YouTube connection successful")
+                else:
+                    self._run_on_ui(messagebox.showerror, "Error", "Failed to connect to YouTube API")
+                    
+            except Exception as e:
+                self._run_on_ui(messagebox.showerror, "Error", f"Failed to test YouTube connection: {e}")
+        
+        self._update_status("Testing YouTube connection...")
+        self._submit_task(self._test_executor, test_worker)
     
     def _test_spotify_connection(self):
         """Test Spotify API connection"""
-        try:
-            client_id = self.spotify_client_id_entry.get()
-            client_secret = self.spotify_client_secret_entry.get()
-            
-            if not client_id or not client_secret:
-                messagebox.showwarning("Warning", "Please enter Spotify Client ID and Secret")
-                return
-            
-            from ..api.spotify_service import SpotifyService
-            service = SpotifyService(client_id, client_secret)
-            
-            if service.test_connection():
-                messagebox.showinfo("Success", "Spotify connection successful!")
-                self._update_status("Spotify connection successful")
-            else:
-                messagebox.showerror("Error", "Failed to connect to Spotify API")
+        client_id = self.spotify_client_id_entry.get()
+        client_secret = self.spotify_client_secret_entry.get()
+        
+        if not client_id or not client_secret:
+            messagebox.showwarning("Warning", "Please enter Spotify Client ID and Secret")
+            return
+        
+        def test_worker():
+            try:
+                from ..api.spotify_service import SpotifyService
+                service = SpotifyService(client_id, client_secret)
                 
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to test Spotify connection: {e}")
+                if service.test_connection():
+                    self._run_on_ui(messagebox.showinfo, "Success", "Spotify connection successful!")
+                    self._run_on_ui(self._update_status, "Spotify connection successful")
+                else:
+                    self._run_on_ui(messagebox.showerror, "Error", "Failed to connect to Spotify API")
+                    
+            except Exception as e:
+                self._run_on_ui(messagebox.showerror, "Error", f"Failed to test Spotify connection: {e}")
+        
+        self._update_status("Testing Spotify connection...")
+        self._submit_task(self._test_executor, test_worker)
     
     def _test_azure_connection(self):
         """Test Azure Storage connection"""
-        try:
-            connection_string = self.azure_connection_entry.get()
-            container_name = self.azure_container_entry.get() or "tts-audio"
-            
-            if not connection_string or connection_string == 'your_azure_storage_connection_string_here':
-                messagebox.showwarning("Warning", "Please enter Azure Storage connection string")
-                return
-            
-            # Create temporary Azure uploader
-            uploader = AzureBlobUploader(
-                connection_string=connection_string,
-                container_name=container_name
-            )
-            
-            # Test by trying to list blobs
-            if uploader.blob_service_client:
-                try:
-                    # Try to get container properties to test connection
-                    container_client = uploader.blob_service_client.get_container_client(container_name)
-                    
-                    # This will create the container if it doesn't exist or just access it if it does
+        connection_string = self.azure_connection_entry.get()
+        container_name = self.azure_container_entry.get() or "tts-audio"
+        
+        if not connection_string or connection_string == AZURE_CONNECTION_PLACEHOLDER:
+            messagebox.showwarning("Warning", "Please enter Azure Storage connection string")
+            return
+        
+        def test_worker():
+            try:
+                # Create temporary Azure uploader
+                from ..uploader.azure_uploader import AzureBlobUploader
+                uploader = AzureBlobUploader(
+                    connection_string=connection_string,
+                    container_name=container_name
+                )
+                
+                # Test by trying to list blobs
+                if uploader.blob_service_client:
                     try:
-                        container_client.get_container_properties()
-                        status_message = f"Connected successfully to container '{container_name}'"
-                    except Exception:
-                        # Container doesn't exist, try to create it
-                        container_client.create_container(public_access="blob")
-                        status_message = f"Connected successfully and created new container '{container_name}'"
-                    
-                    messagebox.showinfo("Success", status_message)
-                    self._update_status("Azure connection successful")
+                        # Try to get container properties to test connection
+                        container_client = uploader.blob_service_client.get_container_client(container_name)
+                        
+                        # This will create the container if it doesn't exist or just access it if it does
+                        if container_client.exists():
+                            status_message = f"Connected successfully to container '{container_name}'"
+                        else:
+                            # Container doesn't exist, try to create it
+                            container_client.create_container(public_access="blob")
+                            status_message = f"Connected successfully and created new container '{container_name}'"
+                        
+                        self._run_on_ui(messagebox.showinfo, "Success", status_message)
+                        self._run_on_ui(self._update_status, "Azure connection successful")
+                        
+                    except Exception as e:
+                        self._run_on_ui(messagebox.showerror, "Error", f"Failed to access container: {e}")
+                else:
+                    self._run_on_ui(messagebox.showerror, "Error", "Failed to create Azure client")
                     
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to access container: {e}")
-            else:
-                messagebox.showerror("Error", "Failed to create Azure client")
-                
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to connect to Azure: {e}")
+            except Exception as e:
+                self._run_on_ui(messagebox.showerror, "Error", f"Failed to connect to Azure: {e}")
+        
+        self._update_status("Testing Azure connection...")
+        self._submit_task(self._test_executor, test_worker)
     
     def _fetch_playlist(self):
         """Fetch playlist from Last.fm"""
         def fetch_worker():
             try:
                 if not self.config.lastfm_api_key or not self.config.lastfm_username:
-                    messagebox.showerror("Error", "Please configure Last.fm API settings first")
+                    self._run_on_ui(messagebox.showerror, "Error", "Please configure Last.fm API settings first")
                     return
                 
-                self._update_status("Fetching playlist...")
-                
-                # Initialize API if needed
-                if not self.lastfm_api:
-                    self.lastfm_api = LastFMAPI(
-                        self.config.lastfm_api_key,
-                        self.config.lastfm_api_secret,
-                        self.config.lastfm_username
-                    )
+                self._run_on_ui(self._update_status, "Fetching playlist...")
                 
                 playlist_type = self.playlist_type_var.get()
-                limit = int(self.limit_var.get())
+                limit = int(self.limit_entry.get())
                 
                 if playlist_type == "top_tracks":
                     period = self.period_var.get()
@@ -699,17 +1021,18 @@ class TTSMixmasterApp:
                     playlist = self.lastfm_api.create_playlist_from_loved_tracks(limit)
                 else:  # recent_tracks
                     tracks = self.lastfm_api.get_user_recent_tracks(limit=limit)
+                    from ..api.lastfm_client import Playlist
                     playlist = Playlist(name="Recent Tracks", tracks=tracks)
                 
                 self.current_playlists.append(playlist)
-                self._update_playlist_display()
-                self._update_status(f"Fetched playlist: {playlist.name} ({len(playlist.tracks)} tracks)")
+                self._run_on_ui(self._update_playlist_display)
+                self._run_on_ui(self._update_status, f"Fetched playlist: {playlist.name} ({len(playlist.tracks)} tracks)")
                 
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to fetch playlist: {e}")
-                self._update_status("Failed to fetch playlist")
+                self._run_on_ui(messagebox.showerror, "Error", f"Failed to fetch playlist: {e}")
+                self._run_on_ui(self._update_status, "Failed to fetch playlist")
         
-        threading.Thread(target=fetch_worker, daemon=True).start()
+        self._submit_task(self._fetch_executor, fetch_worker)
     
     def _clear_playlists(self):
         """Clear all playlists"""
@@ -719,24 +1042,30 @@ class TTSMixmasterApp:
     
     def _update_playlist_display(self):
         """Update playlist display"""
-        self.playlist_text.delete("1.0", tk.END)
-        
-        for i, playlist in enumerate(self.current_playlists):
-            self.playlist_text.insert(tk.END, f"Playlist {i+1}: {playlist.name}\n")
-            self.playlist_text.insert(tk.END, f"Description: {playlist.description}\n")
-            self.playlist_text.insert(tk.END, f"Tracks: {len(playlist.tracks)}\n\n")
-            
-            for j, track in enumerate(playlist.tracks[:10]):  # Show first 10 tracks
-                self.playlist_text.insert(tk.END, f"  {j+1:2d}. {track.artist} - {track.title}\n")
-            
-            if len(playlist.tracks) > 10:
-                self.playlist_text.insert(tk.END, f"  ... and {len(playlist.tracks) - 10} more tracks\n")
+        tree = self.playlist_tree
+        insert = tree.insert
+        
+        # Playlists are only ever appended or cleared, so add rows for new ones only
+        drawn = self._playlists_drawn
+        if drawn > len(self.current_playlists):
+            tree.delete(*tree.get_children())
+            drawn = 0
+        self._playlists_drawn = len(self.current_playlists)
+        
+        for i, playlist in enumerate(self.current_playlists[drawn:], drawn + 1):
+            tracks = playlist.tracks
+            insert("", "end", values=("", _PLAYLIST_HEADER.format(i, playlist.name),
+                                      _PLAYLIST_COUNT.format(len(tracks))))
             
-            self.playlist_text.insert(tk.END, "\n" + "="*50 + "\n\n")
+            for j, track in enumerate(tracks, 1):
+                insert("", "end", values=(j, track.artist, track.title))
     
     def _start_download(self):
         """Start downloading tracks"""
         def download_worker():
+            self._cancel_event.clear()
+            if self._closing.is_set():
+                return
             try:
                 # Get tracks from the new playlist tab manager
                 playlist_info = None
@@ -750,106 +1079,167 @@ class TTSMixmasterApp:
                         # Fallback to any loaded tracks from playlist tab
                         all_tracks = self.playlist_tab_manager.get_selected_playlist_tracks()
                         if not all_tracks:
-                            messagebox.showwarning("Warning", "No playlist selected or playlist has no tracks. Please select a playlist and load its tracks first.")
+                            self._run_on_ui(messagebox.showwarning, "Warning", "No playlist selected or playlist has no tracks. Please select a playlist and load its tracks first.")
                             return
                         playlist_name = "Selected Playlist"
                 else:
                     # Fallback to legacy playlists if playlist tab manager is not available
                     if not self.current_playlists:
-                        messagebox.showwarning("Warning", "No playlists to download")
+                        self._run_on_ui(messagebox.showwarning, "Warning", "No playlists to download")
                         return
                     
                     # Get all tracks from all playlists
-                    all_tracks = []
-                    for playlist in self.current_playlists:
-                        all_tracks.extend(playlist.tracks)
+                    all_tracks = list(itertools.chain.from_iterable(
+                        playlist.tracks for playlist in self.current_playlists
+                    ))
                     playlist_name = "Legacy Playlists"
                 
                 if not all_tracks:
-                    messagebox.showwarning("Warning", "No tracks found to download")
+                    self._run_on_ui(messagebox.showwarning, "Warning", "No tracks found to download")
                     return
                 
-                self._update_status(f"Starting download of {len(all_tracks)} tracks from {playlist_name}...")
-                
-                # Initialize downloader
-                if not self.downloader:
-                    self.downloader = AudioDownloader(
-                        self.config.download_path,
-                        self.config.audio_quality
-                    )
+                self._run_on_ui(self._update_status, f"Starting download of {len(all_tracks)} tracks from {playlist_name}...")
                 
                 # Use playlist-specific download if we have a single playlist
                 if playlist_info:
                     # Download to playlist-specific folder
-                    from ..utils.config import create_playlist_directories
                     playlist_paths = create_playlist_directories(self.config, playlist_name)
                     
-                    self._update_status(f"Downloading to playlist folder: {playlist_paths['download']}")
+                    self._run_on_ui(self._update_status, f"Downloading to playlist folder: {playlist_paths['download']}")
                     
                     # Use the new playlist download method
                     self.download_results = self.downloader.download_playlist(
                         playlist_info, 
-                        playlist_paths['download']
+                        playlist_paths['download'],
+                        max_workers=self.config.download_workers,
+                        cancel_event=self._cancel_event
                     )
                     
                     # Update progress for display
-                    self.download_progress.set(1.0)
-                    self._update_download_results()
+                    self._download_progress_pending = 1.0
+                    self._mark_progress_dirty()
+                    self._download_results_dirty = True
+                    self._mark_results_dirty()
+                    
+                    if self._cancel_event.is_set():
+                        self._run_on_ui(self._update_status, "Download stopped")
+                        return
                     
                     stats = self.downloader.get_download_statistics(self.download_results)
-                    self._update_status(f"Playlist download complete: {stats['successful_downloads']}/{stats['total_tracks']} successful in {playlist_paths['download']}")
+                    self._run_on_ui(self._update_status, f"Playlist download complete: {stats['successful_downloads']}/{stats['total_tracks']} successful in {playlist_paths['download']}")
                     
                 else:
                     # Fallback to individual track downloads (legacy mode)
-                    self.download_progress.set(0)
+                    self._download_progress_pending = 0.0
+                    self._mark_progress_dirty()
                     total_tracks = len(all_tracks)
                     
                     self.download_results = []
-                    for i, track in enumerate(all_tracks):
-                        self._update_status(f"Downloading {i+1}/{total_tracks}: {track.artist} - {track.title}")
-                        
-                        result = self.downloader.search_and_download_track(track)
-                        self.download_results.append(result)
-                        
-                        # Update progress
-                        progress = (i + 1) / total_tracks
-                        self.download_progress.set(progress)
+                    
+                    # Create the download folder once instead of per track
+                    self.downloader.download_path.mkdir(parents=True, exist_ok=True)
+                    
+                    # Bind hot-loop attributes once
+                    download_track = self.downloader.search_and_download_track
+                    run_on_ui = self._run_on_ui
+                    set_status = self._update_status
+                    add_result = self.download_results.append
+                    cancelled = self._cancel_event.is_set
+                    workers = max(1, min(self.config.download_workers, total_tracks))
+                    
+                    # Search and download tracks concurrently; both steps are network-bound
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = {executor.submit(download_track, track, skip_mkdir=True): track
+                                   for track in all_tracks}
                         
-                        # Update results display
-                        self._update_download_results()
+                        for i, future in enumerate(as_completed(futures)):
+                            track = futures[future]
+                            add_result(future.result())
+                            run_on_ui(set_status, f"Downloaded {i+1}/{total_tracks}: {track.artist} - {track.title}")
+                            
+                            # Update progress
+                            self._download_progress_pending = (i + 1) / total_tracks
+                            self._mark_progress_dirty()
+                            
+                            # Mark results for the next throttled repaint
+                            self._download_results_dirty = True
+                            self._mark_results_dirty()
+                            
+                            # Drop queued tracks once stopped; in-flight ones finish
+                            if cancelled():
+                                for pending in futures:
+                                    pending.cancel()
+                                break
+                    
+                    # Keep results in playlist order
+                    self.download_results = [future.result() for future in futures if not future.cancelled()]
+                    self._download_results_dirty = True
+                    self._mark_results_dirty()
+                    
+                    if cancelled():
+                        self._run_on_ui(self._update_status, f"Download stopped after {len(self.download_results)}/{total_tracks} tracks")
+                        return
                     
                     stats = self.downloader.get_download_statistics(self.download_results)
-                    self._update_status(f"Download complete: {stats['successful_downloads']}/{stats['total_tracks']} successful")
+                    self._run_on_ui(self._update_status, f"Download complete: {stats['successful_downloads']}/{stats['total_tracks']} successful")
                 
             except Exception as e:
-                messagebox.showerror("Error", f"Download failed: {e}")
-                self._update_status("Download failed")
+                self._run_on_ui(messagebox.showerror, "Error", f"Download failed: {e}")
+                self._run_on_ui(self._update_status, "Download failed")
         
-        threading.Thread(target=download_worker, daemon=True).start()
+        self._download_future = self._submit_task(self._download_executor, download_worker)
+    
+    def _get_successful_downloads(self) -> List["DownloadResult"]:
+        """Successful download results, filtered once per results list"""
+        results = self.download_results
+        if self._successful_downloads_src is not results or self._successful_downloads_len != len(results):
+            self._successful_downloads = [result for result in results if result.success]
+            self._successful_downloads_src = results
+            self._successful_downloads_len = len(results)
+        return self._successful_downloads
     
     def _stop_download(self):
         """Stop download process"""
-        # This would need to be implemented with proper thread management
-        self._update_status("Download stopped")
+        future = self._download_future
+        if future is None or future.done():
+            self._update_status("No download in progress")
+            return
+        
+        # A queued download is dropped outright; a running one stops after its in-flight tracks
+        self._cancel_event.set()
+        if future.cancel():
+            self._update_status("Download stopped")
+        else:
+            self._update_status("Stopping download...")
     
     def _update_download_results(self):
         """Update download results display"""
-        self.download_results_text.delete("1.0", tk.END)
+        if not hasattr(self, 'download_results_text'):
+            return
         
-        successful = 0
-        failed = 0
+        # Append only rows added since the last draw; a new results list starts over
+        results = self.download_results
+        if results is not self._download_drawn_list:
+            self._download_drawn_list = results
+            self._download_drawn = 0
+            self._download_succ = 0
+            self._download_fail = 0
+        drawn = self._download_drawn
         
-        for result in self.download_results:
+        lines = []
+        
+        for result in results[drawn:]:
             if result.success:
-                successful += 1
-                self.download_results_text.insert(tk.END, f"✓ {result.track.artist} - {result.track.title}\n")
-                self.download_results_text.insert(tk.END, f"  File: {result.file_path}\n\n")
+                self._download_succ += 1
+                lines.append(f"✓ {result.track.artist} - {result.track.title}\n  File: {result.file_path}\n\n")
             else:
-                failed += 1
-                self.download_results_text.insert(tk.END, f"✗ {result.track.artist} - {result.track.title}\n")
-                self.download_results_text.insert(tk.END, f"  Error: {result.error_message}\n\n")
+                self._download_fail += 1
+                lines.append(f"✗ {result.track.artist} - {result.track.title}\n  Error: {result.error_message}\n\n")
+        self._download_drawn = drawn + len(lines)
         
-        self.download_results_text.insert(tk.END, f"\nSummary: {successful} successful, {failed} failed")
+        self._append_results(self.download_results_text, lines,
+                             f"\nSummary: {self._download_succ} successful, {self._download_fail} failed",
+                             redraw=not drawn)
     
     def _prepare_uploads(self):
         """Prepare upload folders from playlist downloads"""
@@ -858,7 +1248,6 @@ class TTSMixmasterApp:
             if hasattr(self, 'playlist_tab_manager') and self.playlist_tab_manager:
                 selected_playlist = self.playlist_tab_manager.get_selected_playlist()
                 if selected_playlist:
-                    from ..utils.config import create_playlist_directories
                     playlist_paths = create_playlist_directories(self.config, selected_playlist.name)
                     
                     # Copy audio files from download folder to upload folder
@@ -866,15 +1255,16 @@ class TTSMixmasterApp:
                     upload_folder = playlist_paths['upload']
                     
                     if download_folder.exists():
-                        from ..utils.config import is_audio_file
-                        import shutil
-                        
-                        audio_files = [f for f in download_folder.iterdir() if is_audio_file(str(f))]
+                        # One directory scan, matching extensions on the entry name without building Paths
+                        with os.scandir(download_folder) as entries:
+                            audio_files = [entry for entry in entries
+                                           if os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS]
                         
-                        for audio_file in audio_files:
-                            dest_file = upload_folder / audio_file.name
-                            if not dest_file.exists():
-                                shutil.copy2(audio_file, dest_file)
+                        pending = [(entry.path, upload_folder / entry.name) for entry in audio_files]
+                        pending = [(src, dst) for src, dst in pending if not dst.exists()]
+                        if pending:
+                            with ThreadPoolExecutor(max_workers=min(_COPY_WORKERS, len(pending))) as executor:
+                                list(executor.map(lambda pair: _link_or_copy(*pair), pending))
                         
                         # Copy manifest file too
                         manifest_file = download_folder / "playlist_manifest.txt"
@@ -893,73 +1283,161 @@ class TTSMixmasterApp:
     
     def _start_upload(self):
         """Start uploading to Azure Blob Storage"""
+        force = self.force_upload_var.get()
+        
         def upload_worker():
             try:
                 if not self.download_results:
-                    messagebox.showwarning("Warning", "No downloaded files to upload")
+                    self._run_on_ui(messagebox.showwarning, "Warning", "No downloaded files to upload")
                     return
                 
-                # Initialize Azure uploader
-                if not self.uploader:
-                    config = self.config_manager.get_config()
-                    if not config.azure_storage_connection_string or config.azure_storage_connection_string == 'your_azure_storage_connection_string_here':
-                        messagebox.showerror("Error", "Please configure Azure Storage settings first")
-                        return
-                    
-                    self.uploader = AzureBlobUploader(
-                        connection_string=config.azure_storage_connection_string,
-                        container_name=config.azure_container_name
-                    )
+                # Get the shared Azure uploader (settings come from the snapshot taken at load/save)
+                config = self.config
+                if not config.azure_configured:
+                    self._run_on_ui(messagebox.showerror, "Error", "Please configure Azure Storage settings first")
+                    return
+                
+                uploader = self._get_uploader()
+                if not uploader.blob_service_client:
+                    self._run_on_ui(messagebox.showerror, "Error", "Failed to create Azure client")
+                    return
                 
-                self._update_status("Starting Azure upload...")
+                self._run_on_ui(self._update_status, "Starting Azure upload...")
                 
                 # Get successful downloads
-                successful_downloads = [result for result in self.download_results if result.success]
+                successful_downloads = self._get_successful_downloads()
                 total_files = len(successful_downloads)
                 
                 if total_files == 0:
-                    messagebox.showwarning("Warning", "No successful downloads to upload")
+                    self._run_on_ui(messagebox.showwarning, "Warning", "No successful downloads to upload")
                     return
                 
                 # Update progress
-                self.upload_progress.set(0)
+                self._upload_progress_pending = 0.0
+                self._mark_progress_dirty()
                 
-                # Upload files
-                self.upload_results = []
-                for i, download_result in enumerate(successful_downloads):
-                    file_path = download_result.file_path
-                    if file_path and os.path.exists(file_path):
-                        self._update_status(f"Uploading {i+1}/{total_files}: {os.path.basename(file_path)}")
-                        
-                        # Upload to Azure
-                        upload_result = self.uploader.upload_audio_file(file_path)
+                # Upload files concurrently; each upload also sends its blocks in parallel
+                upload_paths = [Path(result.file_path) for result in successful_downloads if result.file_path]
+                upload_paths = [path for path in upload_paths if path.exists()]
+                total_uploads = len(upload_paths)
+                
+                # Resolve display names once; results refreshes look them up by path
+                self._upload_names = {str(path): path.name for path in upload_paths}
+                
+                # Files unchanged since their recorded upload are reused without asking Azure
+                from ..uploader.azure_uploader import UploadResult
+                manifest_path = Path(config.upload_path) / _UPLOAD_MANIFEST
+                manifest = _read_upload_manifest(manifest_path)
+                scope = f"{uploader.account_name}/{uploader.container_name}"
+                if force or self._upload_scope_stale:
+                    manifest.pop(scope, None)
+                    self._upload_scope_stale = False
+                uploaded = manifest.setdefault(scope, {})
+                signatures = {}
+                skipped = {}
+                for path in upload_paths:
+                    stat = path.stat()
+                    signature = signatures[path] = [stat.st_size, stat.st_mtime_ns]
+                    entry = uploaded.get(str(path))
+                    if entry and entry[:2] == signature:
+                        skipped[path] = UploadResult(success=True, file_path=str(path), blob_name=entry[2],
+                                                     public_url=entry[3], file_size=stat.st_size)
+                to_upload = [path for path in upload_paths if path not in skipped]
+                workers = max(1, min(self.config.upload_workers, len(to_upload)))
+                
+                self._upload_succ = len(skipped)
+                self._upload_fail = 0
+                self.upload_results = list(skipped.values())
+                self._upload_results_dirty = True
+                self._mark_results_dirty()
+                if total_uploads:
+                    self._upload_progress_pending = len(skipped) / total_uploads
+                    self._mark_progress_dirty()
+                closing = self._closing.is_set
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {executor.submit(uploader.upload_audio_file, str(path),
+                                               max_concurrency=_UPLOAD_BLOCK_CONCURRENCY): path
+                               for path in to_upload}
+                    
+                    for i, future in enumerate(as_completed(futures), len(skipped)):
+                        upload_result = future.result()
+                        if upload_result.success:
+                            self._upload_succ += 1
+                            uploaded[str(futures[future])] = signatures[futures[future]] + [
+                                upload_result.blob_name, upload_result.public_url]
+                        else:
+                            self._upload_fail += 1
                         self.upload_results.append(upload_result)
+                        self._run_on_ui(self._update_status, f"Uploaded {i+1}/{total_uploads}: {futures[future].name}")
                         
                         # Update progress
-                        progress = (i + 1) / total_files
-                        self.upload_progress.set(progress)
+                        progress = (i + 1) / total_uploads
+                        self._upload_progress_pending = progress
+                        self._mark_progress_dirty()
                         
-                        # Update results display
-                        self._update_upload_results()
+                        # Mark results for the next throttled repaint
+                        self._upload_results_dirty = True
+                        self._mark_results_dirty()
+                        
+                        # Drop queued files once the window closes; in-flight ones finish
+                        if closing():
+                            for pending in futures:
+                                pending.cancel()
+                            break
+                
+                if futures:
+                    _write_upload_manifest(manifest_path, manifest)
+                if closing():
+                    return
+                
+                # Keep results in playlist order for TTS formatting
+                results_by_path = {path: future.result() for future, path in futures.items()}
+                results_by_path.update(skipped)
+                self.upload_results = [results_by_path[path] for path in upload_paths]
+                self._upload_results_dirty = True
+                self._mark_results_dirty()
                 
-                successful_uploads = len([r for r in self.upload_results if r.success])
-                self._update_status(f"Upload complete: {successful_uploads}/{total_files} successful")
+                self._run_on_ui(self._update_status, f"Upload complete: {self._upload_succ}/{total_files} successful")
                 
             except Exception as e:
-                messagebox.showerror("Error", f"Upload failed: {e}")
-                self._update_status("Upload failed")
+                self._run_on_ui(messagebox.showerror, "Error", f"Upload failed: {e}")
+                self._run_on_ui(self._update_status, "Upload failed")
         
-        threading.Thread(target=upload_worker, daemon=True).start()
+        self._submit_task(self._upload_executor, upload_worker)
     
-    def _show_upload_instructions(self):
-        """Show upload instructions"""
-        if not self.uploader:
-            # Initialize Azure uploader with config
-            config = self.config_manager.get_config()
+    def _submit_task(self, executor: ThreadPoolExecutor, worker) -> Future:
+        """Submit worker to one of the task executors, tracking it until it finishes"""
+        return self._track_task(executor.submit(worker))
+    
+    def _get_uploader(self) -> "AzureBlobUploader":
+        """Return the shared Azure uploader, rebuilding it only when the Azure settings change"""
+        config = self.config
+        connection_string = config.azure_storage_connection_string if config.azure_configured else ""
+        
+        key = (connection_string, config.azure_container_name)
+        if self.uploader is None or self._uploader_key != key:
+            # Uploads recorded before a settings change are re-checked by uploading again
+            self._upload_scope_stale = self.uploader is not None
+            if self.uploader is not None:
+                self.uploader.close()  # release the old connection pool
+            from ..uploader.azure_uploader import AzureBlobUploader
             self.uploader = AzureBlobUploader(
-                connection_string=config.azure_storage_connection_string if config.azure_storage_connection_string != 'your_azure_storage_connection_string_here' else None,
-                container_name=config.azure_container_name
+                connection_string=connection_string or None,
+                container_name=config.azure_container_name,
+                # Room for every worker's parallel block uploads
+                pool_maxsize=config.upload_workers * _UPLOAD_BLOCK_CONCURRENCY
             )
+            self._uploader_key = key
+        return self.uploader
+    
+    def _show_upload_instructions(self):
+        """Show upload instructions"""
+        # Report from settings; building an uploader here would hit Azure just to show help
+        config = self.config
+        if self.uploader is not None:
+            ready = self.uploader.blob_service_client is not None
+        else:
+            ready = config.azure_configured or bool(os.getenv('AZURE_STORAGE_CONNECTION_STRING'))
         
         # Get Azure setup instructions
         instructions = """
@@ -981,8 +1459,8 @@ Once configured, TTSMixmaster will:
 
 Container: {container}
 Status: {status}        """.strip().format(
-            container=self.uploader.container_name,
-            status="✅ Ready" if self.uploader.blob_service_client else "❌ Not configured"        )
+            container=config.azure_container_name,
+            status="✅ Ready" if ready else "❌ Not configured"        )
         
         # Create new window for instructions
         instruction_window = ctk.CTkToplevel(self.root)
@@ -995,7 +1473,6 @@ Status: {status}        """.strip().format(
     
     def _generate_tts_code(self):
         """Generate TTS code using playlist folders"""
-        import json
         try:
             # Get playlist from the new playlist tab manager
             selected_playlist = None
@@ -1010,32 +1487,46 @@ Status: {status}        """.strip().format(
                 selected_playlist = self.current_playlists[0]  # Use first legacy playlist as fallback
             
             # Get playlist-specific paths
-            from ..utils.config import create_playlist_directories, is_audio_file
             playlist_paths = create_playlist_directories(self.config, selected_playlist.name)
             
             # Initialize formatter with playlist-specific TTS output path
             if not self.formatter:
+                from ..tts_formatter.tts_formatter import TTSFormatter
                 self.formatter = TTSFormatter(str(playlist_paths['tts_output']))
             
             # Create music player with upload results if available, otherwise use local files
             if self.upload_results:
-                music_player = self.formatter.create_music_player_from_playlist_info(selected_playlist, upload_results=self.upload_results)
+                sources = tuple(result.public_url for result in self.upload_results)
             else:
                 # Look for audio files in the playlist download folder
                 local_files = []
                 if playlist_paths['download'].exists():
-                    audio_files = [str(f) for f in playlist_paths['download'].iterdir() if is_audio_file(str(f))]
-                    local_files = audio_files
+                    # scandir yields path strings directly, without a Path object per entry
+                    with os.scandir(playlist_paths['download']) as entries:
+                        local_files = [entry.path for entry in entries
+                                       if os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS]
                 elif self.download_results:
                     # Fallback to download results
-                    local_files = [result.file_path for result in self.download_results 
-                                   if result.success and result.file_path is not None]
-                
-                music_player = self.formatter.create_music_player_from_playlist_info(selected_playlist, local_files=local_files)
+                    local_files = [result.file_path for result in self._get_successful_downloads()
+                                   if result.file_path is not None]
+                sources = tuple(local_files)
+            
+            # Reuse the last music player when only the output options changed; key on
+            # the track data itself, since id() values are recycled once a playlist is freed
+            music_player_key = (selected_playlist.name,
+                                tuple((track.artist, track.title, track.album) for track in selected_playlist.tracks),
+                                bool(self.upload_results), sources)
+            if self._music_player_key != music_player_key:
+                if self.upload_results:
+                    self._music_player = self.formatter.create_music_player_from_playlist_info(selected_playlist, upload_results=self.upload_results)
+                else:
+                    self._music_player = self.formatter.create_music_player_from_playlist_info(selected_playlist, local_files=local_files)
+                self._music_player_key = music_player_key
+            music_player = self._music_player
             
             # Get customization options
-            nickname = self.tts_nickname_var.get().strip()
-            description = self.tts_description_var.get().strip()
+            nickname = self.tts_nickname_entry.get().strip()
+            description = self.tts_description_entry.get().strip()
             image_url = self.tts_image_url_var.get().strip()
             image_secondary_url = self.tts_image_secondary_url_var.get().strip()
             use_simple_format = self.use_simple_format_var.get()
@@ -1063,32 +1554,47 @@ Status: {status}        """.strip().format(
                     image_url=image_url,
                     image_secondary_url=image_secondary_url
                 )
-                code = json.dumps(save_data, indent=2)
+                from ..tts_formatter.tts_formatter import json_bytes
+                code = json_bytes(save_data).decode('utf-8')
             else:
                 code = "Unknown format selected"
             
-            # Display in text widget
-            self.tts_output_text.delete("1.0", "end")
-            self.tts_output_text.insert("1.0", code)
+            # Display in text widget (one delete + insert; skipped when the output is unchanged)
+            if code != self._tts_preview_code:
+                with _suspend_wrap(self.tts_preview_text):
+                    self.tts_preview_text.delete("1.0", "end")
+                    self.tts_preview_text.insert("1.0", code)
+                self._tts_preview_code = code
             
             # Save to playlist TTS folder
             if output_format != "save_file":
                 base_filename = f"{selected_playlist.name.replace(' ', '_')}"
-                saved_files = self.formatter.save_formatted_files(
-                    music_player,
-                    base_filename=base_filename,
-                    nickname=nickname,
-                    description=description,
-                    use_simple_format=use_simple_format,
-                    image_url=image_url,
-                    image_secondary_url=image_secondary_url
-                )
+                formatter = self.formatter
                 
-                self._update_status(f"TTS files generated and saved to: {playlist_paths['tts_output']}")
+                def save_worker():
+                    try:
+                        saved_files = formatter.save_formatted_files(
+                            music_player,
+                            base_filename=base_filename,
+                            nickname=nickname,
+                            description=description,
+                            use_simple_format=use_simple_format,
+                            image_url=image_url,
+                            image_secondary_url=image_secondary_url
+                        )
+                        
+                        self._run_on_ui(self._update_status, f"TTS files generated and saved to: {playlist_paths['tts_output']}")
+                        
+                        # Show saved files info
+                        files_info = "\n".join([f"{key}: {path}" for key, path in saved_files.items()])
+                        self._run_on_ui(messagebox.showinfo, "Files Saved", f"Generated files:\n\n{files_info}")
+                    except Exception as e:
+                        self._run_on_ui(messagebox.showerror, "Error", f"Failed to save TTS files: {e}")
+                        self._run_on_ui(self._update_status, "TTS save failed")
                 
-                # Show saved files info
-                files_info = "\n".join([f"{key}: {path}" for key, path in saved_files.items()])
-                messagebox.showinfo("Files Saved", f"Generated files:\n\n{files_info}")
+                # Write files off the Tk thread so the preview stays responsive
+                self._update_status("Saving TTS files...")
+                self._track_task(self._save_executor.submit(save_worker))
             else:
                 self._update_status(f"TTS save file code generated for playlist: {selected_playlist.name}")
                 
@@ -1098,46 +1604,94 @@ Status: {status}        """.strip().format(
     
     def _open_output_folder(self):
         """Open TTS output folder"""
-        import subprocess
-        import platform
-        
         try:
-            path = self.config.tts_output_path
-            if platform.system() == "Windows":
-                os.startfile(path)
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", path])
-            else:  # Linux
-                subprocess.run(["xdg-open", path])
+            _open_folder(self.config.tts_output_path)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open folder: {e}")
     
     def _update_status(self, message: str):
-        """Update status bar"""
-        self.status_label.configure(text=message)
-        self.root.update_idletasks()
+        """Update status bar (coalesced: only the latest message is drawn per flush)"""
+        self._status_pending = message
+        if not self._status_scheduled:
+            self._status_scheduled = True
+            self.root.after(_STATUS_FLUSH_MS, self._flush_status)
+    
+    def _flush_status(self):
+        """Draw the most recent pending status message"""
+        self._status_scheduled = False
+        if self._status_pending is not None:
+            self.status_label.configure(text=self._status_pending)
+            self._status_pending = None
     
     def _update_upload_results(self):
         """Update upload results display"""
         if not hasattr(self, 'upload_results_text'):
             return
-            
-        self.upload_results_text.delete("1.0", tk.END)
         
-        successful = 0
-        failed = 0
+        # Append only rows added since the last draw; a new results list
+        # (fresh run or final reorder) starts the textbox over
+        results = self.upload_results
+        text = self.upload_results_text
+        if results is not self._upload_drawn_list:
+            self._upload_drawn_list = results
+            self._upload_drawn = 0
+        drawn = self._upload_drawn
+        
+        lines = []
+        names = self._upload_names
         
-        for result in self.upload_results:
+        for result in results[drawn:]:
+            name = names.get(result.file_path) or os.path.basename(result.file_path)
             if result.success:
-                successful += 1
-                self.upload_results_text.insert(tk.END, f"✓ {os.path.basename(result.file_path)}\n")
-                self.upload_results_text.insert(tk.END, f"  URL: {result.public_url}\n\n")
+                lines.append(f"✓ {name}\n  URL: {result.public_url}\n\n")
             else:
-                failed += 1
-                self.upload_results_text.insert(tk.END, f"✗ {os.path.basename(result.file_path)}\n")
-                self.upload_results_text.insert(tk.END, f"  Error: {result.error_message}\n\n")
-        self.upload_results_text.insert(tk.END, f"\nSummary: {successful} successful, {failed} failed")
+                lines.append(f"✗ {name}\n  Error: {result.error_message}\n\n")
+        self._upload_drawn = drawn + len(lines)
+        
+        self._append_results(text, lines, f"\nSummary: {self._upload_succ} successful, {self._upload_fail} failed",
+                             redraw=not drawn)
+    
+    def _append_results(self, text, lines: List[str], summary: str, redraw: bool):
+        """Append result rows to a results textbox and replace its trailing summary"""
+        # Results boxes are read-only logs; they are only editable while being written
+        text.configure(state="normal")
+        with _suspend_wrap(text):
+            # The "summary" mark sits before the summary line; drop from there
+            # (or everything on a redraw) and write the new rows in its place
+            text.delete("1.0" if redraw else "summary", tk.END)
+            text.insert(tk.END, "".join(lines))
+            text.mark_set("summary", "end-1c")
+            text.mark_gravity("summary", tk.LEFT)
+            text.insert(tk.END, summary)
+            
+            # Keep the log bounded on very long runs by dropping the oldest lines
+            line_count = int(text.index("end-1c").split(".")[0])
+            if line_count > _RESULTS_MAX_LINES:
+                text.delete("1.0", f"{line_count - _RESULTS_MAX_LINES + 1}.0")
+        text.configure(state="disabled")
     
     def run(self):
         """Run the application"""
         self.root.mainloop()
+        
+        # TTS saves are never dropped; let them finish writing their files
+        self._save_executor.shutdown(wait=True)
+        
+        # Drop queued tasks and let running ones wind down on exit
+        self._closing.set()
+        self._cancel_event.set()
+        for future in list(self._tasks):
+            future.cancel()
+        running = list(self._tasks)
+        if self.playlist_tab_manager:
+            running += self.playlist_tab_manager.shutdown()
+        for executor in (self._fetch_executor, self._download_executor, self._upload_executor,
+                         self._test_executor):
+            executor.shutdown(wait=False)
+        
+        # Interpreter exit joins worker threads, so a yt-dlp download or upload still in
+        # flight would keep the closed app running; give them a short grace period instead
+        _, not_done = wait(running, timeout=_EXIT_GRACE_S)
+        if not_done:
+            logging.shutdown()
+            os._exit(0)
@@ -8,16 +8,34 @@ that supports multiple music services.
 import tkinter as tk
 from tkinter import ttk, messagebox
 import customtkinter as ctk
-from typing import List, Optional, Dict, Any
-import threading
+from typing import Callable, List, Optional, Dict, Any, Set, Tuple
+import time
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from ..api.service_manager import MusicServiceManager, ServiceType
 from ..api.base_service import PlaylistInfo, PlaylistType
 
+# Seconds fetched playlists are reused for an identical fetch (unless Refresh is ticked)
+_PLAYLIST_CACHE_TTL = 300
+
+# Playlists at the top of a fetched list whose tracks are loaded in the background
+_PREFETCH_PLAYLISTS = 3
+
+# Quiet period after the last dropdown selection before the tracks table is redrawn (ms)
+_SELECT_DEBOUNCE_MS = 150
+
 
 class PlaylistTabManager:
     """Manages the new playlist tab with multi-service support"""
     
+    # Service status label texts (disconnected, connected), built once
+    _SERVICE_DISPLAY = {"lastfm": "Last.fm", "youtube": "YouTube", "spotify": "Spotify"}
+    _STATUS_TEXT = {key: (f"{name}: ❌", f"{name}: ✅") for key, name in _SERVICE_DISPLAY.items()}
+    
+    # Service radio-button values -> ServiceType
+    _SERVICE_TYPES = {service_type.value: service_type for service_type in ServiceType}
+    
     def __init__(self, parent_tab, config_manager, main_app):
         self.parent_tab = parent_tab
         self.config_manager = config_manager
@@ -28,6 +46,19 @@ class PlaylistTabManager:
         self.current_playlists: List[PlaylistInfo] = []
         self.selected_service: Optional[ServiceType] = None
         self.selected_playlist: Optional[PlaylistInfo] = None
+        self._playlist_cache: Dict[tuple, tuple] = {}  # (service, inputs) -> (fetched at, playlists)
+        self._playlist_by_name: Dict[str, PlaylistInfo] = {}  # dropdown name -> playlist
+        self._select_after: Optional[str] = None  # pending tracks-table redraw
+        
+        # One reusable worker for service calls; fetches and track loads run in click order
+        self._worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playlists")
+        self._pending: Set[Future] = set()
+        self._generation = 0  # bumped by Clear so results of earlier requests are dropped
+        
+        # Background track prefetches get their own thread so they never delay a click
+        self._prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        self._prefetches: List[Tuple[PlaylistInfo, Future]] = []
+        self._awaiting_prefetch: Optional[PlaylistInfo] = None  # Load Tracks deferred to its prefetch
         
         # Setup UI
         self._setup_ui()
@@ -35,6 +66,14 @@ class PlaylistTabManager:
     
     def _setup_ui(self):
         """Setup the playlist tab UI"""
+        # Shared label fonts (each CTkFont creates a Tk font resource)
+        self._font_title = ctk.CTkFont(size=20, weight="bold")
+        self._font_header = ctk.CTkFont(size=16, weight="bold")
+        self._font_bold = ctk.CTkFont(weight="bold")
+        
+        # Key-press validator for the numeric limit entries (ASCII digits only; empty while editing)
+        self._digits_only = (self.parent_tab.register(lambda text: text == "" or (text.isascii() and text.isdigit())), "%P")
+        
         # Main container
         main_frame = ctk.CTkFrame(self.parent_tab)
         main_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -43,7 +82,7 @@ class PlaylistTabManager:
         title_label = ctk.CTkLabel(
             main_frame, 
             text="Music Collections & Playlists", 
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=self._font_title
         )
         title_label.pack(pady=(10, 20))
           # Service selection frame
@@ -67,7 +106,7 @@ class PlaylistTabManager:
         service_select_frame = ctk.CTkFrame(service_frame)
         service_select_frame.pack(fill="x", padx=10, pady=10)
         
-        ctk.CTkLabel(service_select_frame, text="Music Service:", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
+        ctk.CTkLabel(service_select_frame, text="Music Service:", font=self._font_bold).pack(side="left", padx=5)
         
         self.service_var = ctk.StringVar(value="lastfm")
         service_options = [
@@ -92,23 +131,23 @@ class PlaylistTabManager:
         self.options_frame = ctk.CTkFrame(service_frame)
         self.options_frame.pack(fill="x", padx=10, pady=5)
         
-        # Create option panels for each service (initially hidden)
-        self._create_lastfm_options()
-        self._create_youtube_options()
-        self._create_spotify_options()
+        # Option panels are built the first time their service is selected
+        self._option_builders = {
+            "lastfm": self._create_lastfm_options,
+            "youtube": self._create_youtube_options,
+            "spotify": self._create_spotify_options,
+        }
         
         # Show initial service options
         self._on_service_changed()
     
     def _create_lastfm_options(self):
         """Create Last.fm specific options"""
-        self.lastfm_options = ctk.CTkFrame(self.options_frame)
+        # One gridded frame per panel; each row holds a label and its controls
+        self.lastfm_options = frame = ctk.CTkFrame(self.options_frame)
         
         # Collection type selection
-        type_frame = ctk.CTkFrame(self.lastfm_options)
-        type_frame.pack(fill="x", padx=5, pady=5)
-        
-        ctk.CTkLabel(type_frame, text="Collection Type:").pack(side="left", padx=5)
+        ctk.CTkLabel(frame, text="Collection Type:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
         self.lastfm_type_var = ctk.StringVar(value="top_tracks")
         lastfm_types = [
             ("Top Tracks", "top_tracks"),
@@ -116,88 +155,77 @@ class PlaylistTabManager:
             ("Recent Tracks", "recent_tracks")
         ]
         
-        for text, value in lastfm_types:
-            radio = ctk.CTkRadioButton(type_frame, text=text, variable=self.lastfm_type_var, value=value)
-            radio.pack(side="left", padx=10)
+        for column, (text, value) in enumerate(lastfm_types, 1):
+            radio = ctk.CTkRadioButton(frame, text=text, variable=self.lastfm_type_var, value=value)
+            radio.grid(row=0, column=column, padx=10, pady=5, sticky="w")
         
         # Period and limit for top tracks
-        params_frame = ctk.CTkFrame(self.lastfm_options)
-        params_frame.pack(fill="x", padx=5, pady=5)
-        
-        ctk.CTkLabel(params_frame, text="Time Period:").pack(side="left", padx=5)
+        ctk.CTkLabel(frame, text="Time Period:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
         self.lastfm_period_var = ctk.StringVar(value="overall")
         periods = ["overall", "7day", "1month", "3month", "6month", "12month"]
-        self.lastfm_period_combo = ctk.CTkComboBox(params_frame, values=periods, variable=self.lastfm_period_var, width=120)
-        self.lastfm_period_combo.pack(side="left", padx=5)
+        self.lastfm_period_combo = ctk.CTkComboBox(frame, values=periods, variable=self.lastfm_period_var, width=120)
+        self.lastfm_period_combo.grid(row=1, column=1, padx=5, pady=5, sticky="w")
         
-        ctk.CTkLabel(params_frame, text="Limit:").pack(side="left", padx=(20, 5))
+        ctk.CTkLabel(frame, text="Limit:").grid(row=1, column=2, padx=(20, 5), pady=5, sticky="e")
         self.lastfm_limit_var = ctk.StringVar(value="50")
-        self.lastfm_limit_entry = ctk.CTkEntry(params_frame, width=80, textvariable=self.lastfm_limit_var)
-        self.lastfm_limit_entry.pack(side="left", padx=5)
+        self.lastfm_limit_entry = ctk.CTkEntry(frame, width=80, textvariable=self.lastfm_limit_var,
+                                               validate="key", validatecommand=self._digits_only)
+        self.lastfm_limit_entry.grid(row=1, column=3, padx=5, pady=5, sticky="w")
     
     def _create_youtube_options(self):
         """Create YouTube specific options"""
-        self.youtube_options = ctk.CTkFrame(self.options_frame)
+        self.youtube_options = frame = ctk.CTkFrame(self.options_frame)
         
         # Action type selection
-        action_frame = ctk.CTkFrame(self.youtube_options)
-        action_frame.pack(fill="x", padx=5, pady=5)
-        
-        ctk.CTkLabel(action_frame, text="Action:").pack(side="left", padx=5)
+        ctk.CTkLabel(frame, text="Action:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
         self.youtube_action_var = ctk.StringVar(value="my_playlists")
         youtube_actions = [
             ("My Playlists", "my_playlists"),
             ("Search Playlists", "search")
         ]
         
-        for text, value in youtube_actions:
-            radio = ctk.CTkRadioButton(action_frame, text=text, variable=self.youtube_action_var, value=value)
-            radio.pack(side="left", padx=10)
-        
-        # Search query frame
-        search_frame = ctk.CTkFrame(self.youtube_options)
-        search_frame.pack(fill="x", padx=5, pady=5)
+        for column, (text, value) in enumerate(youtube_actions, 1):
+            radio = ctk.CTkRadioButton(frame, text=text, variable=self.youtube_action_var, value=value)
+            radio.grid(row=0, column=column, padx=10, pady=5, sticky="w")
         
-        ctk.CTkLabel(search_frame, text="Search Query:").pack(side="left", padx=5)
+        # Search query and limit
+        ctk.CTkLabel(frame, text="Search Query:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
         self.youtube_search_var = ctk.StringVar()
-        self.youtube_search_entry = ctk.CTkEntry(search_frame, textvariable=self.youtube_search_var, width=300)
-        self.youtube_search_entry.pack(side="left", padx=5)
+        self.youtube_search_entry = ctk.CTkEntry(frame, textvariable=self.youtube_search_var, width=300)
+        self.youtube_search_entry.grid(row=1, column=1, columnspan=2, padx=5, pady=5, sticky="w")
         
-        ctk.CTkLabel(search_frame, text="Limit:").pack(side="left", padx=(20, 5))
+        ctk.CTkLabel(frame, text="Limit:").grid(row=1, column=3, padx=(20, 5), pady=5, sticky="e")
         self.youtube_limit_var = ctk.StringVar(value="20")
-        self.youtube_limit_entry = ctk.CTkEntry(search_frame, width=80, textvariable=self.youtube_limit_var)
-        self.youtube_limit_entry.pack(side="left", padx=5)
+        self.youtube_limit_entry = ctk.CTkEntry(frame, width=80, textvariable=self.youtube_limit_var,
+                                                validate="key", validatecommand=self._digits_only)
+        self.youtube_limit_entry.grid(row=1, column=4, padx=5, pady=5, sticky="w")
     
     def _create_spotify_options(self):
         """Create Spotify specific options"""
-        self.spotify_options = ctk.CTkFrame(self.options_frame)
+        self.spotify_options = frame = ctk.CTkFrame(self.options_frame)
         
         # Action type selection
-        action_frame = ctk.CTkFrame(self.spotify_options)
-        action_frame.pack(fill="x", padx=5, pady=5)
-        
-        ctk.CTkLabel(action_frame, text="Action:").pack(side="left", padx=5)
+        ctk.CTkLabel(frame, text="Action:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
         self.spotify_action_var = ctk.StringVar(value="my_playlists")
         spotify_actions = [
             ("My Playlists", "my_playlists"),
             ("Search Playlists", "search")
         ]
         
-        for text, value in spotify_actions:
-            radio = ctk.CTkRadioButton(action_frame, text=text, variable=self.spotify_action_var, value=value)
-            radio.pack(side="left", padx=10)        # User ID and search frame
-        params_frame = ctk.CTkFrame(self.spotify_options)
-        params_frame.pack(fill="x", padx=5, pady=5)
+        for column, (text, value) in enumerate(spotify_actions, 1):
+            radio = ctk.CTkRadioButton(frame, text=text, variable=self.spotify_action_var, value=value)
+            radio.grid(row=0, column=column, padx=10, pady=5, sticky="w")
         
-        ctk.CTkLabel(params_frame, text="User ID (optional):").pack(side="left", padx=5)
+        # User ID and search
+        ctk.CTkLabel(frame, text="User ID (optional):").grid(row=1, column=0, padx=5, pady=5, sticky="w")
         self.spotify_user_var = ctk.StringVar()
-        self.spotify_user_entry = ctk.CTkEntry(params_frame, textvariable=self.spotify_user_var, width=150)
-        self.spotify_user_entry.pack(side="left", padx=5)
+        self.spotify_user_entry = ctk.CTkEntry(frame, textvariable=self.spotify_user_var, width=150)
+        self.spotify_user_entry.grid(row=1, column=1, padx=5, pady=5, sticky="w")
         
-        ctk.CTkLabel(params_frame, text="Search/Limit:").pack(side="left", padx=(20, 5))
+        ctk.CTkLabel(frame, text="Search/Limit:").grid(row=1, column=2, padx=(20, 5), pady=5, sticky="e")
         self.spotify_search_var = ctk.StringVar()
-        self.spotify_search_entry = ctk.CTkEntry(params_frame, textvariable=self.spotify_search_var, width=200)
-        self.spotify_search_entry.pack(side="left", padx=5)
+        self.spotify_search_entry = ctk.CTkEntry(frame, textvariable=self.spotify_search_var, width=200)
+        self.spotify_search_entry.grid(row=1, column=3, padx=5, pady=5, sticky="w")
     
     def _create_controls_frame(self, parent):
         """Create control buttons"""
@@ -216,6 +244,10 @@ class PlaylistTabManager:
         )
         self.fetch_button.pack(side="left", padx=5)
         
+        # Refresh bypasses cached playlists and already-loaded tracks
+        self.refresh_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(button_frame, text="Refresh", variable=self.refresh_var).pack(side="left", padx=5)
+        
         # Clear button
         self.clear_button = ctk.CTkButton(
             button_frame,
@@ -238,7 +270,7 @@ class PlaylistTabManager:
         selection_frame = ctk.CTkFrame(controls_frame)
         selection_frame.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkLabel(selection_frame, text="Select Playlist:", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
+        ctk.CTkLabel(selection_frame, text="Select Playlist:", font=self._font_bold).pack(side="left", padx=5)
         
         self.playlist_var = ctk.StringVar()
         self.playlist_dropdown = ctk.CTkComboBox(
@@ -263,11 +295,11 @@ class PlaylistTabManager:
         status_frame = ctk.CTkFrame(controls_frame)
         status_frame.pack(fill="x", padx=10, pady=5)
         
-        ctk.CTkLabel(status_frame, text="Service Status:", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=5)
+        ctk.CTkLabel(status_frame, text="Service Status:", font=self._font_bold).pack(side="left", padx=5)
         
         self.status_labels = {}
-        for service in ["lastfm", "youtube", "spotify"]:
-            label = ctk.CTkLabel(status_frame, text=f"{service.title()}: ❌", text_color="red")
+        for service, (off_text, _) in self._STATUS_TEXT.items():
+            label = ctk.CTkLabel(status_frame, text=off_text, text_color="red")
             label.pack(side="left", padx=10)
             self.status_labels[service] = label
 
@@ -276,7 +308,7 @@ class PlaylistTabManager:
         results_frame = ctk.CTkFrame(parent)
         results_frame.pack(fill="both", expand=True, padx=10, pady=5)
         
-        ctk.CTkLabel(results_frame, text="Tracks", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=5)
+        ctk.CTkLabel(results_frame, text="Tracks", font=self._font_header).pack(pady=5)
         
         # Create tracks table directly (no tabs needed)
         self._create_tracks_table(results_frame)
@@ -301,13 +333,41 @@ class PlaylistTabManager:
         self.tracks_table.column("#", width=40, anchor="center")
         self.tracks_table.column("Artist", width=200)
         self.tracks_table.column("Title", width=300)
-        self.tracks_table.pack(fill="both", expand=True)
+        
+        # The table only ever holds the visible slice of the playlist; this scrollbar moves the slice
+        self.tracks_scrollbar = ctk.CTkScrollbar(self.tracks_frame, command=self._on_tracks_scroll)
+        self.tracks_scrollbar.pack(side="right", fill="y")
+        self.tracks_table.pack(side="left", fill="both", expand=True)
+        
+        self._all_tracks: List = []
+        self._tracks_first = 0
+        self._track_row_height: Optional[int] = None
+        self._track_header_height = 0
+        self._tracks_rows = 0  # rows in the slice last drawn
+        self._selected_track: Optional[int] = None  # index into _all_tracks, kept across slice shifts
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tracks_table.bind(sequence, self._on_tracks_wheel)
+        for sequence in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.tracks_table.bind(sequence, self._on_tracks_key)
+        self.tracks_table.bind("<<TreeviewSelect>>", self._on_track_selected)
+        self.tracks_table.bind("<Configure>", self._on_tracks_configure)
 
     def _populate_playlist_dropdown(self):
         """Populate the playlist dropdown with current playlists"""
-        names = [pl.name for pl in self.current_playlists] if self.current_playlists else ["No playlists available"]
-        self.playlist_dropdown.configure(values=names)
-        self.playlist_dropdown.configure(state="normal" if self.current_playlists else "disabled")
+        # Map dropdown names to playlists, suffixing repeated names so each stays selectable
+        self._playlist_by_name = {}
+        for pl in self.current_playlists:
+            key = pl.name
+            n = 2
+            while key in self._playlist_by_name:
+                key = f"{pl.name} ({n})"
+                n += 1
+            self._playlist_by_name[key] = pl
+        
+        names = list(self._playlist_by_name) or ["No playlists available"]
+        # A refetch returning the same names leaves the combobox untouched (state follows the names)
+        if names != self.playlist_dropdown.cget("values"):
+            self.playlist_dropdown.configure(values=names, state="normal" if self.current_playlists else "disabled")
         if self.current_playlists:
             self.playlist_var.set(names[0])
             self._on_playlist_selected(names[0])
@@ -321,229 +381,456 @@ class PlaylistTabManager:
             self._clear_tracks_table()
             return
         name = selected_name or self.playlist_var.get()
-        playlist = next((pl for pl in self.current_playlists if pl.name == name), None)
+        playlist = self._playlist_by_name.get(name)
         self.selected_playlist = playlist
-        if playlist:
-            # Enable the load tracks button
-            self.load_tracks_button.configure(state="normal")            # If playlist already has tracks, show them immediately
-            if playlist.tracks:
-                self._update_tracks_table(playlist)
-            else:
-                self._clear_tracks_table()
-        else:
-            self._clear_tracks_table()
-            self.load_tracks_button.configure(state="disabled")
+        self.load_tracks_button.configure(state="normal" if playlist else "disabled")
+        
+        # Redraw the table only once the selection settles
+        if self._select_after:
+            self.parent_tab.after_cancel(self._select_after)
+        self._select_after = self.parent_tab.after(_SELECT_DEBOUNCE_MS, self._show_selected_tracks)
+    
+    def _show_selected_tracks(self):
+        """Show the selected playlist's tracks if they are already loaded"""
+        self._select_after = None
+        playlist = self.selected_playlist
+        
+        # The table already shows these tracks (e.g. reselecting the playlist on display)
+        if playlist and playlist.tracks and playlist.tracks is self._all_tracks:
+            return
+        self._update_tracks_table(playlist)
 
     def _update_tracks_table(self, playlist):
         """Update the tracks table with tracks from the selected playlist"""
-        self._clear_tracks_table()
-        if not playlist or not playlist.tracks:
-            return
-        for idx, track in enumerate(playlist.tracks, 1):
-            self.tracks_table.insert("", "end", values=(idx, getattr(track, "artist", ""), getattr(track, "title", "")))
+        self._all_tracks = playlist.tracks if playlist and playlist.tracks else []
+        self._selected_track = None
+        self._show_tracks_window(0)
 
     def _clear_tracks_table(self):
         """Clear all rows from the tracks table"""
         if hasattr(self, "tracks_table"):
-            for row in self.tracks_table.get_children():
-                self.tracks_table.delete(row)
+            self._all_tracks = []
+            self._selected_track = None
+            self._show_tracks_window(0)
+
+    def _visible_track_rows(self) -> int:
+        """Number of rows that fit in the tracks table at its current size"""
+        table = self.tracks_table
+        children = table.get_children()
+        bbox = table.bbox(children[0]) if children else None
+        if bbox:
+            # (x, y, width, height) of the first row; y is the heading height
+            self._track_header_height, self._track_row_height = bbox[1], bbox[3]
+        if not self._track_row_height:
+            return int(table.cget("height"))
+        return max(1, (table.winfo_height() - self._track_header_height) // self._track_row_height)
+
+    def _show_tracks_window(self, first: int):
+        """Fill the tracks table with the slice of tracks that fits, starting at index first"""
+        tracks = self._all_tracks
+        total = len(tracks)
+        visible = self._visible_track_rows()
+        first = max(0, min(first, total - visible))
+        self._tracks_first = first
+        self._tracks_rows = visible
+        
+        table = self.tracks_table
+        table.delete(*table.get_children())
+        insert = table.insert
+        # Rows are keyed by track index so the selection can be restored after a shift;
+        # both Track types declare artist and title, so plain attribute access is safe
+        for idx, track in enumerate(tracks[first:first + visible], first):
+            insert("", "end", iid=str(idx), values=(idx + 1, track.artist, track.title))
+        
+        selected = self._selected_track
+        if selected is not None and first <= selected < first + visible:
+            table.selection_set(str(selected))
+            table.focus(str(selected))
+        
+        if total > visible:
+            self.tracks_scrollbar.set(first / total, (first + visible) / total)
+        else:
+            self.tracks_scrollbar.set(0, 1)
+        
+        # Row height is only known once a row has been laid out; refit the slice then
+        if tracks and not self._track_row_height:
+            table.after_idle(self._fit_tracks_window)
+
+    def _fit_tracks_window(self):
+        """Refit the tracks slice once the first row can be measured"""
+        if self._track_row_height is None:
+            self._track_row_height = 0  # measure once; a failed measurement keeps the default height
+            self._show_tracks_window(self._tracks_first)
+
+    def _on_tracks_scroll(self, action, amount, unit="units"):
+        """Scrollbar command: move the tracks slice (Tk moveto/scroll protocol)"""
+        if action == "moveto":
+            first = int(float(amount) * len(self._all_tracks))
+        else:
+            step = float(amount)
+            # Fractional wheel deltas still move by at least one row
+            step = int(step) or (1 if step > 0 else -1 if step < 0 else 0)
+            if unit == "pages":
+                step *= self._visible_track_rows()
+            first = self._tracks_first + step
+        self._show_tracks_window(first)
+
+    def _on_tracks_wheel(self, event):
+        """Mouse wheel over the tracks table moves the slice by three rows"""
+        up = event.num == 4 or event.delta > 0
+        self._show_tracks_window(self._tracks_first + (-3 if up else 3))
+        return "break"
+
+    def _on_tracks_key(self, event):
+        """Arrow/page/home/end keys move the selection over the whole playlist, shifting the slice to follow"""
+        total = len(self._all_tracks)
+        if not total:
+            return "break"
+        first = self._tracks_first
+        visible = self._visible_track_rows()
+        current = self._selected_track if self._selected_track is not None else first
+        if event.keysym == "Home":
+            target = 0
+        elif event.keysym == "End":
+            target = total - 1
+        else:
+            step = {"Up": -1, "Down": 1, "Prior": -visible, "Next": visible}[event.keysym]
+            target = current + step if self._selected_track is not None else current
+        target = max(0, min(target, total - 1))
+        self._selected_track = target
+        
+        if target < first:
+            first = target
+        elif target >= first + visible:
+            first = target - visible + 1
+        self._show_tracks_window(first)
+        return "break"
+
+    def _on_track_selected(self, event):
+        """Remember the selected row's track index so it survives slice shifts"""
+        selection = self.tracks_table.selection()
+        if selection:
+            self._selected_track = int(selection[0])
+        elif self._selected_track is not None and \
+                self._tracks_first <= self._selected_track < self._tracks_first + self._tracks_rows:
+            # Deselected while on screen (rows scrolled out of the slice keep their selection)
+            self._selected_track = None
+
+    def _on_tracks_configure(self, event):
+        """Redraw the slice only when a resize changes how many rows fit"""
+        if self._visible_track_rows() != self._tracks_rows:
+            self._show_tracks_window(self._tracks_first)
 
     def _on_service_changed(self):
         """Handle service selection change"""
-        # Hide all option frames
-        for frame in [self.lastfm_options, self.youtube_options, self.spotify_options]:
-            frame.pack_forget()
+        service = self.service_var.get()
+        frame_attr = f"{service}_options"
+        if not hasattr(self, frame_attr):
+            self._option_builders[service]()
+        
+        # Hide all built option frames
+        for name in self._option_builders:
+            frame = getattr(self, f"{name}_options", None)
+            if frame is not None:
+                frame.pack_forget()
         
         # Show selected service options
-        service = self.service_var.get()
-        if service == "lastfm":
-            self.lastfm_options.pack(fill="x", padx=5, pady=5)
-        elif service == "youtube":
-            self.youtube_options.pack(fill="x", padx=5, pady=5)
-        elif service == "spotify":
-            self.spotify_options.pack(fill="x", padx=5, pady=5)
+        getattr(self, frame_attr).pack(fill="x", padx=5, pady=5)
     
     def _initialize_services(self):
         """Initialize services with configuration"""
         config = self.config_manager.get_config()
-          # Initialize Last.fm
+        pending = {}
+        
+        # Initialize Last.fm
         if config.lastfm_api_key and config.lastfm_username:
-            lastfm_creds = {
+            pending[ServiceType.LASTFM] = {
                 'api_key': config.lastfm_api_key,
                 'api_secret': config.lastfm_api_secret,
                 'username': config.lastfm_username
             }
-            if self.service_manager.configure_service(ServiceType.LASTFM, lastfm_creds):
-                self.status_labels["lastfm"].configure(text="Last.fm: ✅", text_color="green")
         
         # Initialize YouTube
         if config.youtube_api_key:
-            youtube_creds = {
+            pending[ServiceType.YOUTUBE] = {
                 'api_key': config.youtube_api_key,
                 'channel_id': config.youtube_channel_id
             }
-            if self.service_manager.configure_service(ServiceType.YOUTUBE, youtube_creds):
-                self.status_labels["youtube"].configure(text="YouTube: ✅", text_color="green")
         
         # Initialize Spotify
         if config.spotify_client_id and config.spotify_client_secret:
-            spotify_creds = {
+            pending[ServiceType.SPOTIFY] = {
                 'client_id': config.spotify_client_id,
                 'client_secret': config.spotify_client_secret,
                 'user_id': config.spotify_user_id
             }
-            if self.service_manager.configure_service(ServiceType.SPOTIFY, spotify_creds):
-                self.status_labels["spotify"].configure(text="Spotify: ✅", text_color="green")
+        
+        if not pending:
+            self._update_service_status()
+            return
+        
+        # Each service pings its API while configuring; run them side by side off the Tk thread
+        def configure_all():
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                list(executor.map(self.service_manager.configure_service, pending, pending.values()))
+        
+        def done(future: Future):
+            if not future.cancelled() and future.exception() is not None:
+                logging.getLogger(__name__).error("Error configuring services", exc_info=future.exception())
+            run_on_ui(self._show_services_ready)
+        
+        # Services only report enabled once their ping returns, so Fetch waits for it
+        run_on_ui = self.main_app._run_on_ui
+        self.fetch_button.configure(state="disabled")
+        self._update_status("Connecting to services...")
+        future = self._worker.submit(configure_all)
+        future.add_done_callback(done)
+        self.main_app._track_task(future)
+    
+    def _show_services_ready(self):
+        """Refresh the service labels and enable Fetch once configuration has finished"""
+        self._update_service_status()
+        self.fetch_button.configure(state="normal")
+        self._update_status("Ready")
     
     def reinitialize_services(self):
         """Reinitialize services with updated configuration"""
+        # Cached playlists may belong to the previous accounts
+        self._playlist_cache.clear()
         self._initialize_services()
-        
-        # Update status display to reflect current service states
-        enabled_services = self.service_manager.get_enabled_services()
-        
-        # Reset all status labels first
-        for service_key in self.status_labels:
-            service_name = service_key.title()
-            if service_key == "lastfm":
-                service_name = "Last.fm"
-            self.status_labels[service_key].configure(text=f"{service_name}: ❌", text_color="red")
-        
-        # Update enabled services
-        for service_type in enabled_services:
-            service_key = service_type.value
-            service_name = service_key.title()
-            if service_key == "lastfm":
-                service_name = "Last.fm"
-            self.status_labels[service_key].configure(text=f"{service_name}: ✅", text_color="green")
+    
+    def _update_service_status(self):
+        """Show each service's enabled state, configuring every label once"""
+        enabled = {service_type.value for service_type in self.service_manager.get_enabled_services()}
+        for key, label in self.status_labels.items():
+            off_text, on_text = self._STATUS_TEXT[key]
+            if key in enabled:
+                label.configure(text=on_text, text_color="green")
+            else:
+                label.configure(text=off_text, text_color="red")
     
     def _fetch_playlists(self):
         """Fetch playlists from selected service"""
+        # Read the Tk inputs here on the UI thread; only the service calls run on the worker
+        try:
+            service_str = self.service_var.get()
+            service_type = self._SERVICE_TYPES[service_str]
+            
+            if not self.service_manager.is_service_enabled(service_type):
+                messagebox.showerror("Error", f"{self._SERVICE_DISPLAY[service_str]} service is not configured or enabled")
+                return
+            
+            if service_type == ServiceType.LASTFM:
+                inputs = (self.lastfm_type_var.get(), self.lastfm_period_var.get(), self._get_limit(self.lastfm_limit_var))
+                fetch = self._fetch_lastfm_collections(*inputs)
+            elif service_type == ServiceType.YOUTUBE:
+                action = self.youtube_action_var.get()
+                limit = self._get_limit(self.youtube_limit_var) if action == "search" else None
+                inputs = (action, self.youtube_search_var.get().strip(), limit)
+                fetch = self._fetch_youtube_playlists(*inputs)
+            else:  # spotify
+                inputs = (self.spotify_action_var.get(), self.spotify_user_var.get().strip(),
+                          self.spotify_search_var.get().strip())
+                fetch = self._fetch_spotify_playlists(*inputs)
+        except ValueError as e:
+            messagebox.showerror("Error", f"Failed to fetch playlists: {e}")
+            return
+        
+        # Repeat fetches within the TTL reuse the last result (recent tracks are always live)
+        key = None if inputs[0] == "recent_tracks" else (service_type, inputs)
+        cached = self._playlist_cache.get(key)
+        if cached and not self.refresh_var.get() and time.monotonic() - cached[0] < _PLAYLIST_CACHE_TTL:
+            self._show_fetched_playlists(cached[1], service_str)
+            return
+        
         def fetch_worker():
             try:
-                service_str = self.service_var.get()
-                service_type = ServiceType(service_str)
-                
-                if not self.service_manager.is_service_enabled(service_type):
-                    messagebox.showerror("Error", f"{service_str.title()} service is not configured or enabled")
-                    return
-                
-                self._update_status("Fetching playlists...")
-                
-                if service_type == ServiceType.LASTFM:
-                    self._fetch_lastfm_collections()
-                elif service_type == ServiceType.YOUTUBE:
-                    self._fetch_youtube_playlists()
-                elif service_type == ServiceType.SPOTIFY:
-                    self._fetch_spotify_playlists()                
-                self._populate_playlist_dropdown()
-                self._update_status(f"Fetched {len(self.current_playlists)} playlists from {service_str.title()}")
-                
+                return self._show_fetched_playlists, fetch(), service_str, key
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to fetch playlists: {e}")
-                self._update_status("Failed to fetch playlists")
+                return self._show_error, "Failed to fetch playlists", e
         
-        threading.Thread(target=fetch_worker, daemon=True).start()
+        self._update_status("Fetching playlists...")
+        self._submit(fetch_worker)
+    
+    def _submit(self, worker: Callable[[], tuple], executor: Optional[ThreadPoolExecutor] = None) -> Future:
+        """Run worker on the service thread (or executor), then call the (callback, *args) it returns on the Tk thread"""
+        generation = self._generation
+        run_on_ui = self.main_app._run_on_ui
+        
+        def apply(callback, *args):
+            # Results of requests made before the last Clear are dropped
+            if generation == self._generation:
+                callback(*args)
+        
+        def done(future: Future):
+            self._pending.discard(future)
+            if not future.cancelled():
+                run_on_ui(apply, *future.result())
+        
+        future = (executor or self._worker).submit(worker)
+        self._pending.add(future)
+        future.add_done_callback(done)
+        self.main_app._track_task(future)  # keeps the UI queue polled until done has queued its result
+        return future
+    
+    def shutdown(self) -> List[Future]:
+        """Drop queued service requests and release the worker threads (on app exit); returns those still running"""
+        self._generation += 1
+        for future in list(self._pending):
+            future.cancel()
+        self._worker.shutdown(wait=False)
+        self._prefetcher.shutdown(wait=False)
+        return [future for future in list(self._pending) if not future.done()]
+    
+    def _show_error(self, action: str, error: Exception):
+        """Report a failed service request"""
+        messagebox.showerror("Error", f"{action}: {error}")
+        self._update_status(action)
+    
+    @staticmethod
+    def _get_limit(var) -> int:
+        """Read a limit entry's value (its entry only accepts ASCII digits, but may be left empty)"""
+        # Parsed in Python: Tcl would read a leading zero as octal ("010" -> 8)
+        text = var.get()
+        if not text:
+            raise ValueError("Limit is required")
+        return int(text)
     
-    def _fetch_lastfm_collections(self):
-        """Fetch Last.fm collections"""
-        collection_type = self.lastfm_type_var.get()
-        limit = int(self.lastfm_limit_var.get())
-        period = self.lastfm_period_var.get()
+    def _show_fetched_playlists(self, playlists: List[PlaylistInfo], service_str: str, key: Optional[tuple] = None):
+        """Display fetched playlists, caching them under key when given"""
+        if key is not None:
+            self._playlist_cache[key] = (time.monotonic(), playlists)
+        self.current_playlists = list(playlists)
+        self.selected_playlist = None
+        self._populate_playlist_dropdown()
+        self._update_status(f"Fetched {len(playlists)} playlists from {self._SERVICE_DISPLAY[service_str]}")
+        
+        # Load the first few playlists' tracks while the user is still choosing
+        self._cancel_prefetches()
+        for playlist in playlists[:_PREFETCH_PLAYLISTS]:
+            if not playlist.tracks and playlist.service_id:
+                future = self._submit(self._prefetch_worker(playlist), self._prefetcher)
+                self._prefetches.append((playlist, future))
+    
+    def _cancel_prefetches(self):
+        """Drop prefetches that have not started yet"""
+        for _, future in self._prefetches:
+            future.cancel()
+        self._prefetches = []
+        self._awaiting_prefetch = None
+    
+    def _prefetch_worker(self, playlist: PlaylistInfo) -> Callable[[], tuple]:
+        """Return a worker that loads a playlist's tracks in the background"""
+        def prefetch_worker():
+            try:
+                tracks = self.service_manager.get_playlist_tracks(playlist.service_type, playlist.service_id).tracks
+            except Exception:
+                tracks = None  # Load Tracks will retry and report the error
+            return self._store_prefetched_tracks, playlist, tracks
+        return prefetch_worker
+    
+    def _store_prefetched_tracks(self, playlist: PlaylistInfo, tracks: Optional[List]):
+        """Keep background-loaded tracks unless the playlist was loaded meanwhile"""
+        self._prefetches = [entry for entry in self._prefetches if entry[0] is not playlist]
+        if tracks and not playlist.tracks:
+            playlist.tracks = tracks
+            if playlist is self.selected_playlist:
+                self._update_tracks_table(playlist)
         
+        # A Load Tracks click was waiting on this prefetch; finish it (a failed prefetch is retried)
+        if playlist is self._awaiting_prefetch:
+            self._awaiting_prefetch = None
+            if playlist.tracks:
+                self._update_status(f"Loaded {len(playlist.tracks)} tracks")
+            else:
+                self._load_tracks(playlist)
+    
+    def _fetch_lastfm_collections(self, collection_type: str, period: str, limit: int) -> Callable[[], List[PlaylistInfo]]:
+        """Return a callable that fetches the chosen Last.fm collection"""
         if collection_type == "top_tracks":
-            playlist = self.service_manager.get_playlist_tracks(
-                ServiceType.LASTFM, "top_tracks", 
-                period=period, limit=limit
-            )
-        elif collection_type == "loved_tracks":
-            playlist = self.service_manager.get_playlist_tracks(
-                ServiceType.LASTFM, "loved_tracks", 
-                limit=limit
-            )
-        else:  # recent_tracks
-            playlist = self.service_manager.get_playlist_tracks(
-                ServiceType.LASTFM, "recent_tracks", 
-                limit=limit
-            )
+            kwargs = {"period": period, "limit": limit}
+        else:  # loved_tracks / recent_tracks
+            kwargs = {"limit": limit}
         
-        self.current_playlists = [playlist]
-        self.selected_playlist = playlist
+        def fetch():
+            return [self.service_manager.get_playlist_tracks(ServiceType.LASTFM, collection_type, **kwargs)]
+        return fetch
     
-    def _fetch_youtube_playlists(self):
-        """Fetch YouTube playlists"""
-        action = self.youtube_action_var.get()
-        
+    def _fetch_youtube_playlists(self, action: str, query: str, limit: Optional[int]) -> Callable[[], List[PlaylistInfo]]:
+        """Return a callable that fetches YouTube playlists"""
         if action == "my_playlists":
-            playlists = self.service_manager.get_user_playlists(ServiceType.YOUTUBE)
-        else:  # search
-            query = self.youtube_search_var.get().strip()
-            if not query:
-                raise ValueError("Search query is required")
-            
-            limit = int(self.youtube_limit_var.get())
-            playlists = self.service_manager.search_playlists(ServiceType.YOUTUBE, query, limit)
+            return lambda: self.service_manager.get_user_playlists(ServiceType.YOUTUBE)
         
-        self.current_playlists = playlists
-        self.selected_playlist = None
+        # search
+        if not query:
+            raise ValueError("Search query is required")
+        return lambda: self.service_manager.search_playlists(ServiceType.YOUTUBE, query, limit)
     
-    def _fetch_spotify_playlists(self):
-        """Fetch Spotify playlists"""
-        action = self.spotify_action_var.get()
-        
+    def _fetch_spotify_playlists(self, action: str, user_id: str, query: str) -> Callable[[], List[PlaylistInfo]]:
+        """Return a callable that fetches Spotify playlists"""
         if action == "my_playlists":
-            user_id = self.spotify_user_var.get().strip()
             kwargs = {}
             if user_id:
                 kwargs['user_id'] = user_id
-            
-            playlists = self.service_manager.get_user_playlists(ServiceType.SPOTIFY, **kwargs)
-        else:  # search
-            query = self.spotify_search_var.get().strip()
-            if not query:
-                raise ValueError("Search query is required")
-            playlists = self.service_manager.search_playlists(ServiceType.SPOTIFY, query, 20)
-        
-        self.current_playlists = playlists
-        self.selected_playlist = None
+            return lambda: self.service_manager.get_user_playlists(ServiceType.SPOTIFY, **kwargs)
+        
+        # search
+        if not query:
+            raise ValueError("Search query is required")
+        return lambda: self.service_manager.search_playlists(ServiceType.SPOTIFY, query, 20)
     
-    def _load_tracks(self):
+    def _load_tracks(self, playlist: Optional[PlaylistInfo] = None):
         """Load tracks for selected playlist"""
-        if not self.selected_playlist:
+        playlist = playlist or self.selected_playlist
+        if not playlist:
             messagebox.showwarning("Warning", "Please select a playlist first")
             return
-            
+        if not playlist.service_id:
+            messagebox.showerror("Error", "Failed to load tracks: No playlist selected or playlist has no service ID")
+            return
+        
+        # Tracks already loaded (kept with cached playlists) are shown by selection; only Refresh refetches
+        if playlist.tracks and not self.refresh_var.get():
+            self._update_status(f"Loaded {len(playlist.tracks)} tracks")
+            return
+        
+        # A queued prefetch of this playlist is dropped; a running one delivers the tracks instead
+        for prefetched, future in self._prefetches:
+            if prefetched is playlist and not future.cancel():
+                self._awaiting_prefetch = playlist
+                self._update_status("Loading tracks...")
+                return
+        
+        service_type = self._SERVICE_TYPES[self.service_var.get()]
+        
         def load_worker():
             try:
-                self._update_status("Loading tracks...")
-                
-                # Get the service type
-                service_str = self.service_var.get()
-                service_type = ServiceType(service_str)                # Load tracks for the selected playlist
-                if self.selected_playlist and self.selected_playlist.service_id:
-                    playlist_with_tracks = self.service_manager.get_playlist_tracks(
-                        service_type, 
-                        self.selected_playlist.service_id
-                    )
-                    
-                    # Update the selected playlist with loaded tracks
-                    self.selected_playlist.tracks = playlist_with_tracks.tracks
-                    
-                    # Update the tracks table
-                    self._update_tracks_table(self.selected_playlist)
-                    
-                    self._update_status(f"Loaded {len(self.selected_playlist.tracks)} tracks")
-                else:
-                    raise ValueError("No playlist selected or playlist has no service ID")
-                
+                playlist_with_tracks = self.service_manager.get_playlist_tracks(service_type, playlist.service_id)
+                return self._show_loaded_tracks, playlist, playlist_with_tracks.tracks
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to load tracks: {e}")
-                self._update_status("Failed to load tracks")        
-        threading.Thread(target=load_worker, daemon=True).start()
+                return self._show_error, "Failed to load tracks", e
+        
+        self._update_status("Loading tracks...")
+        self._submit(load_worker)
+    
+    def _show_loaded_tracks(self, playlist: PlaylistInfo, tracks: List):
+        """Store tracks returned by a load worker and show them if the playlist is still selected"""
+        playlist.tracks = tracks
+        if playlist is self.selected_playlist:
+            self._update_tracks_table(playlist)
+        self._update_status(f"Loaded {len(tracks)} tracks")
         
     def _clear_results(self):
         """Clear all results"""
+        # Drop queued requests and ignore the results of one already running
+        self._generation += 1
+        for future in list(self._pending):
+            future.cancel()
+        self._cancel_prefetches()
+        
         self.current_playlists.clear()
+        self._playlist_cache.clear()
+        self._playlist_by_name.clear()
         self.selected_playlist = None
         self._clear_tracks_table()
         self.playlist_dropdown.configure(values=["No playlists available"], state="disabled")
@@ -573,24 +860,23 @@ class PlaylistTabManager:
         """Debugging function to show service configurations"""
         config = self.config_manager.get_config()
         
-        debug_info = "=== Service Configurations ===\n\n"
-        
-        # Last.fm
-        debug_info += "[Last.fm]\n"
-        debug_info += f"API Key: {config.lastfm_api_key}\n"
-        debug_info += f"API Secret: {config.lastfm_api_secret}\n"
-        debug_info += f"Username: {config.lastfm_username}\n\n"
-        
-        # YouTube
-        debug_info += "[YouTube]\n"
-        debug_info += f"API Key: {config.youtube_api_key}\n"
-        debug_info += f"Channel ID: {config.youtube_channel_id}\n\n"
-        
-        # Spotify
-        debug_info += "[Spotify]\n"
-        debug_info += f"Client ID: {config.spotify_client_id}\n"
-        debug_info += f"Client Secret: {config.spotify_client_secret}\n"
-        debug_info += f"User ID: {config.spotify_user_id}\n"
+        debug_info = (
+            "=== Service Configurations ===\n\n"
+            # Last.fm
+            "[Last.fm]\n"
+            f"API Key: {config.lastfm_api_key}\n"
+            f"API Secret: {config.lastfm_api_secret}\n"
+            f"Username: {config.lastfm_username}\n\n"
+            # YouTube
+            "[YouTube]\n"
+            f"API Key: {config.youtube_api_key}\n"
+            f"Channel ID: {config.youtube_channel_id}\n\n"
+            # Spotify
+            "[Spotify]\n"
+            f"Client ID: {config.spotify_client_id}\n"
+            f"Client Secret: {config.spotify_client_secret}\n"
+            f"User ID: {config.spotify_user_id}\n"
+        )
         
         # Show debug info in a message box instead
         messagebox.showinfo("Debug Info", debug_info)
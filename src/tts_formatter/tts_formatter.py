@@ -11,12 +11,53 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, asdict
 import urllib.parse
+from functools import lru_cache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..api.base_service import Track
 from ..api.lastfm_client import Playlist
 from ..uploader.azure_uploader import UploadResult
 
 
+# One playlist entry in generate_lua_script: name, url, volume, pitch, loop, loopstart
+_LUA_ENTRY = """{{
+        name = "{0}",
+        url = "{1}",
+        volume = {2},
+        pitch = {3},
+        loop = {4},
+        loopstart = {5}
+    }}"""
+
+
+# Characters escaped inside double-quoted Lua strings
+_LUA_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '"': '\\"',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+})
+
+
+@lru_cache(maxsize=4096)
+def _escape_lua(text: str) -> str:
+    """Escape text for a double-quoted Lua string (memoized; each output escapes the same names and URLs)"""
+    return text.translate(_LUA_ESCAPES)
+
+
+def json_bytes(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
 @dataclass
 class TTSAudioObject:
     """Represents an audio object in Tabletop Simulator format"""
@@ -211,20 +252,13 @@ class TTSFormatter:
         Returns:
             Lua script as string
         """
-        playlist_data = []
-        
-        for audio in music_player.playlist:
-            playlist_entry = f"""{{
-        name = "{self._escape_lua_string(audio.name)}",
-        url = "{self._escape_lua_string(audio.url)}",
-        volume = {audio.volume},
-        pitch = {audio.pitch},
-        loop = {str(audio.loop).lower()},
-        loopstart = {audio.loopstart}
-    }}"""
-            playlist_data.append(playlist_entry)
-        
-        playlist_string = ",\n    ".join(playlist_data)
+        escape = _escape_lua
+        entry = _LUA_ENTRY.format
+        playlist_string = ",\n    ".join(
+            entry(escape(audio.name), escape(audio.url), audio.volume, audio.pitch,
+                  "true" if audio.loop else "false", audio.loopstart)
+            for audio in music_player.playlist
+        )
         
         lua_script = f"""-- {music_player.name} - Generated by TTSMixmaster
 -- Music Player for Tabletop Simulator
@@ -358,8 +392,8 @@ return {object_name}"""
         
         for audio in music_player.playlist:
             # Use title field instead of name for consistency with the target format
-            title_text = self._escape_lua_string(audio.name)
-            url_text = self._escape_lua_string(audio.url)
+            title_text = _escape_lua(audio.name)
+            url_text = _escape_lua(audio.url)
             
             entry = f"""    {{
         title = "{title_text}",
@@ -388,13 +422,8 @@ return {object_name}"""
         Returns:
             Escaped text
         """
-        # Escape backslashes first, then quotes
-        text = text.replace("\\", "\\\\")
-        text = text.replace('"', '\\"')
-        text = text.replace('\n', '\\n')
-        text = text.replace('\r', '\\r')
-        text = text.replace('\t', '\\t')
-        return text
+        # One pass; translate never re-escapes its own output, so order does not matter
+        return _escape_lua(text)
     
     def generate_json_data(self, music_player: TTSMusicPlayer) -> str:
         """
@@ -406,7 +435,7 @@ return {object_name}"""
         Returns:
             JSON string        """
         data = music_player.to_dict()
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        return json_bytes(data).decode('utf-8')
     
     def generate_save_file(self, music_player: TTSMusicPlayer, 
                           object_guid: Optional[str] = None, nickname: str = "", 
@@ -554,45 +583,34 @@ return {object_name}"""
             safe_name = "".join(c for c in music_player.name if c.isalnum() or c in (' ', '-', '_'))
             base_filename = safe_name.replace(' ', '_')
         
-        saved_files = {}
-        
-        # Save Lua script
-        lua_script = self.generate_lua_script(music_player)
-        lua_path = self.output_path / f"{base_filename}.lua"
-        with open(lua_path, 'w', encoding='utf-8') as f:
-            f.write(lua_script)
-        saved_files['lua'] = str(lua_path)
-        
-        # Save simple playlist Lua script
-        simple_lua_script = self.generate_simple_playlist_lua(music_player)
-        simple_lua_path = self.output_path / f"{base_filename}_simple.lua"
-        with open(simple_lua_path, 'w', encoding='utf-8') as f:
-            f.write(simple_lua_script)
-        saved_files['simple_lua'] = str(simple_lua_path)
-        
-        # Save JSON data
-        json_data = self.generate_json_data(music_player)
-        json_path = self.output_path / f"{base_filename}_data.json"
-        with open(json_path, 'w', encoding='utf-8') as f:
-            f.write(json_data)
-        saved_files['json'] = str(json_path)        
-        # Save TTS save file
-        save_data = self.generate_save_file(music_player, nickname=nickname, 
-                                          description=description, 
-                                          use_simple_format=use_simple_format,
-                                          image_url=image_url,
-                                          image_secondary_url=image_secondary_url)
-        save_path = self.output_path / f"{base_filename}.json"
-        with open(save_path, 'w', encoding='utf-8') as f:
-            json.dump(save_data, f, indent=2, ensure_ascii=False)
-        saved_files['save_file'] = str(save_path)
-        
-        # Save text summary
-        summary = self.generate_text_summary(music_player)
-        txt_path = self.output_path / f"{base_filename}_summary.txt"
-        with open(txt_path, 'w', encoding='utf-8') as f:
-            f.write(summary)
-        saved_files['summary'] = str(txt_path)
+        def render_save_file(player: TTSMusicPlayer) -> bytes:
+            save_data = self.generate_save_file(player, nickname=nickname, 
+                                                description=description, 
+                                                use_simple_format=use_simple_format,
+                                                image_url=image_url,
+                                                image_secondary_url=image_secondary_url)
+            return json_bytes(save_data)
+        
+        def write_output(filename: str, render) -> str:
+            output_file = self.output_path / filename
+            content = render(music_player)
+            # The save file is already UTF-8 bytes; write it without a decode/encode round trip
+            if isinstance(content, bytes):
+                output_file.write_bytes(content)
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    f.write(content)
+            return str(output_file)
+        
+        # Render outputs on this thread; the GIL would serialise the string work anyway
+        outputs = [
+            ('lua', f"{base_filename}.lua", self.generate_lua_script),
+            ('simple_lua', f"{base_filename}_simple.lua", self.generate_simple_playlist_lua),
+            ('json', f"{base_filename}_data.json", self.generate_json_data),
+            ('save_file', f"{base_filename}.json", render_save_file),
+            ('summary', f"{base_filename}_summary.txt", self.generate_text_summary),
+        ]
+        saved_files = {key: write_output(filename, render) for key, filename, render in outputs}
         
         return saved_files
     
@@ -18,6 +18,8 @@ try:
     from azure.storage.blob import BlobServiceClient, ContainerClient, PublicAccess
     from azure.storage.blob import ContentSettings
     from azure.core.exceptions import AzureError
+    from azure.core.pipeline.transport import RequestsTransport
+    import requests
     AZURE_AVAILABLE = True
 except ImportError:
     AZURE_AVAILABLE = False
@@ -27,6 +29,12 @@ except ImportError:
 from ..api.lastfm_client import Track
 
 
+# Chunked-upload sizes; the SDK default single-put limit (64 MiB) buffers whole
+# audio files, so keep puts small and stream larger files in bounded blocks
+_MAX_SINGLE_PUT_SIZE = 8 * 1024 * 1024
+_MAX_BLOCK_SIZE = 4 * 1024 * 1024
+
+
 @dataclass
 class UploadResult:
     """Represents the result of an upload operation"""
@@ -44,7 +52,8 @@ class AzureBlobUploader:
     """Uploads audio files to Azure Blob Storage for TTS integration"""
     
     def __init__(self, connection_string: Optional[str] = None, account_name: Optional[str] = None, 
-                 account_key: Optional[str] = None, container_name: str = "tts-audio"):
+                 account_key: Optional[str] = None, container_name: str = "tts-audio",
+                 pool_maxsize: Optional[int] = None):
         """
         Initialize the Azure Blob uploader
         
@@ -53,31 +62,35 @@ class AzureBlobUploader:
             account_name: Azure Storage account name (if not using connection string)
             account_key: Azure Storage account key (if not using connection string)
             container_name: Name of the container to upload to
+            pool_maxsize: HTTP connection pool size (defaults to the SDK's pool of 10)
         """
         self.container_name = container_name
         self.logger = logging.getLogger(__name__)
         self.blob_service_client = None
         self.account_name = account_name or "unknown"
+        self._session: Optional["requests.Session"] = None  # owned by us, not the SDK transport
         
         if not AZURE_AVAILABLE:
             self.logger.error("Azure SDK not available. Install azure-storage-blob to use this uploader.")
             return
             
         try:
+            client_kwargs = self._transport_kwargs(pool_maxsize)
+            client_kwargs.update(max_single_put_size=_MAX_SINGLE_PUT_SIZE, max_block_size=_MAX_BLOCK_SIZE)
             if connection_string:
-                self.blob_service_client = BlobServiceClient.from_connection_string(connection_string)  # type: ignore
+                self.blob_service_client = BlobServiceClient.from_connection_string(connection_string, **client_kwargs)  # type: ignore
                 # Extract account name from connection string if possible
                 if "AccountName=" in connection_string:
                     self.account_name = connection_string.split("AccountName=")[1].split(";")[0]
             elif account_name and account_key:
                 account_url = f"https://{account_name}.blob.core.windows.net"
-                self.blob_service_client = BlobServiceClient(account_url=account_url, credential=account_key)  # type: ignore
+                self.blob_service_client = BlobServiceClient(account_url=account_url, credential=account_key, **client_kwargs)  # type: ignore
                 self.account_name = account_name
             else:
                 # Try to get from environment variables
                 env_connection_string = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
                 if env_connection_string:
-                    self.blob_service_client = BlobServiceClient.from_connection_string(env_connection_string)  # type: ignore
+                    self.blob_service_client = BlobServiceClient.from_connection_string(env_connection_string, **client_kwargs)  # type: ignore
                     if "AccountName=" in env_connection_string:
                         self.account_name = env_connection_string.split("AccountName=")[1].split(";")[0]
                 else:
@@ -91,6 +104,27 @@ class AzureBlobUploader:
             self.logger.error(f"Failed to initialize Azure Blob client: {e}")
             self.blob_service_client = None
     
+    def _transport_kwargs(self, pool_maxsize: Optional[int]) -> Dict[str, Any]:
+        """Build client kwargs for a transport whose connection pool fits pool_maxsize"""
+        if not pool_maxsize:
+            return {}
+        
+        # The SDK's RequestsTransport keeps urllib3's default pool of 10; mount a
+        # larger adapter so parallel uploads reuse keep-alive connections
+        session = self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return {'transport': RequestsTransport(session=session, session_owner=False)}
+    
+    def close(self):
+        """Close the client and the HTTP session behind its connection pool"""
+        if self.blob_service_client is not None:
+            self.blob_service_client.close()
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+    
     def _ensure_container_exists(self):
         """Ensure the container exists and is configured for public access"""
         if not self.blob_service_client:
@@ -114,7 +148,8 @@ class AzureBlobUploader:
             raise
     
     def upload_audio_file(self, file_path: str, track: Optional[Track] = None, 
-                         custom_blob_name: Optional[str] = None) -> UploadResult:
+                         custom_blob_name: Optional[str] = None,
+                         max_concurrency: int = 1) -> UploadResult:
         """
         Upload an audio file to Azure Blob Storage
         
@@ -122,6 +157,7 @@ class AzureBlobUploader:
             file_path: Path to the audio file to upload
             track: Track object for metadata (optional)
             custom_blob_name: Custom blob name (optional, will generate if not provided)
+            max_concurrency: Number of parallel block uploads for this file
             
         Returns:
             UploadResult object
@@ -195,7 +231,9 @@ class AzureBlobUploader:
                 
                 blob_client.upload_blob(  # type: ignore
                     data, 
+                    length=file_size,
                     overwrite=True,
+                    max_concurrency=max_concurrency,
                     content_settings=content_settings,
                     metadata=metadata
                 )
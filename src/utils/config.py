@@ -12,8 +12,18 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
 import configparser
+from functools import lru_cache
 
 
+# File extensions treated as audio files
+AUDIO_EXTENSIONS = frozenset({
+    '.mp3', '.wav', '.flac', '.ogg', '.m4a', '.aac', 
+    '.wma', '.opus', '.mp4', '.m4p', '.3gp'
+})
+
+# Placeholder connection string shipped in config.json.template
+AZURE_CONNECTION_PLACEHOLDER = "your_azure_storage_connection_string_here"
+
 
 @dataclass
 class AppConfig:
@@ -39,6 +49,7 @@ class AppConfig:
     # Azure Storage Settings
     azure_storage_connection_string: str = ""
     azure_container_name: str = "tts-audio"
+    upload_workers: int = 4
     
     # Path Settings
     download_path: str = "./downloads"
@@ -48,11 +59,18 @@ class AppConfig:
     # Audio Settings
     audio_quality: str = "192"
     audio_format: str = "mp3"
+    download_workers: int = 4
     
     # UI Settings
     theme: str = "dark"
     window_size: str = "1200x800"
     
+    @property
+    def azure_configured(self) -> bool:
+        """Whether a real (non-placeholder) Azure connection string is set"""
+        connection_string = self.azure_storage_connection_string
+        return bool(connection_string) and connection_string != AZURE_CONNECTION_PLACEHOLDER
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return asdict(self)
@@ -76,11 +94,13 @@ class ConfigManager:
         self.config_file = Path(config_file)
         self.config = AppConfig()
         
-        # Load configuration
-        self.load_config()
+        # Configuration is loaded from disk on first get_config()
+        self._loaded = False
     
     def load_config(self):
         """Load configuration from file"""
+        self._loaded = True
+        
         # Load from file if it exists
         if self.config_file.exists():
             try:
@@ -94,25 +114,29 @@ class ConfigManager:
     def save_config(self):
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config.to_dict(), f, indent=2)
+            # Serialise the whole config, then write it with a single write_text call
+            self.config_file.write_text(json.dumps(self.config.to_dict(), indent=2))
         except Exception as e:
             logging.error(f"Failed to save config file: {e}")
     
     def get_config(self) -> AppConfig:
-        """Get current configuration"""
+        """Get current configuration, loading it from disk on first access"""
+        if not self._loaded:
+            self.load_config()
         return self.config
     
     def update_config(self, **kwargs):
         """Update configuration values"""
+        config = self.get_config()
         for key, value in kwargs.items():
-            if hasattr(self.config, key):
-                setattr(self.config, key, value)
+            if hasattr(config, key):
+                setattr(config, key, value)
         self.save_config()
     
     def is_configured(self) -> bool:
         """Check if essential configuration is present"""
-        return bool(self.config.lastfm_api_key and self.config.lastfm_username)
+        config = self.get_config()
+        return bool(config.lastfm_api_key and config.lastfm_username)
 
 
 def setup_logging(log_level: str = "INFO", log_file: str = "ttsmixmaster.log"):
@@ -273,12 +297,7 @@ def is_audio_file(file_path: str) -> bool:
     Returns:
         True if it's an audio file, False otherwise
     """
-    audio_extensions = {
-        '.mp3', '.wav', '.flac', '.ogg', '.m4a', '.aac', 
-        '.wma', '.opus', '.mp4', '.m4p', '.3gp'
-    }
-    
-    return Path(file_path).suffix.lower() in audio_extensions
+    return os.path.splitext(file_path)[1].lower() in AUDIO_EXTENSIONS
 
 
 class ProgressTracker:
@@ -322,6 +341,7 @@ class ProgressTracker:
         return f"{self.description}: {self.current}/{self.total} ({percentage:.1f}%)"
 
 
+@lru_cache(maxsize=64)
 def get_playlist_folder_path(base_path: str, playlist_name: str) -> Path:
     """
     Get the folder path for a specific playlist
@@ -422,7 +442,7 @@ def get_playlist_completeness(playlist_folder: Path) -> Dict[str, Any]:
         return {"error": "No manifest file found"}
     
     # Count audio files in the folder
-    audio_files = [f for f in playlist_folder.iterdir() if is_audio_file(str(f))]
+    audio_files = [f for f in playlist_folder.iterdir() if f.suffix.lower() in AUDIO_EXTENSIONS]
     
     # Parse manifest for expected track count
     try: